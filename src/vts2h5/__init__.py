@@ -2,8 +2,26 @@
 
 __version__ = "0.1.0"
 
-from .reader import VTSReader
-from .writer import HDF5Writer
-from .xdmf import XDMFGenerator
-
 __all__ = ["VTSReader", "HDF5Writer", "XDMFGenerator"]
+
+# Public classes are imported on first access, so that the command-line
+# interface does not pay for importing VTK and h5py just to parse arguments
+_LAZY_IMPORTS = {
+    "VTSReader": ".reader",
+    "HDF5Writer": ".writer",
+    "XDMFGenerator": ".xdmf",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
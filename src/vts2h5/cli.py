@@ -1,9 +1,10 @@
 """Command-line interface for vts2h5."""
 
 import argparse
-import re
+import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 
 def parse_args():
@@ -25,7 +26,7 @@ Examples:
   # Use 4 parallel workers for faster conversion
   vts2h5 data/test1 -j 4
 
-  # Use all available CPU cores
+  # Use one worker per physical CPU core
   vts2h5 data/test1 -j 0
 
   # Silent mode (no progress bar, minimal output)
@@ -37,6 +38,9 @@ Examples:
   # Custom output name with parallel processing
   vts2h5 data/test1 --output-name simulation -j 4
 
+  # Store double precision arrays as single precision
+  vts2h5 data/test1 --dtype float32
+
   # Show folder info without conversion
   vts2h5 data/test1 --info
         """,
@@ -75,17 +79,24 @@ Examples:
 
     parser.add_argument(
         "--compression",
-        choices=["gzip", "lzf", "none"],
-        default="gzip",
-        help="Compression algorithm (default: gzip)",
+        choices=["blosc", "blosclz4hc", "zstd", "gzip", "lzf", "none"],
+        default="blosc",
+        help="Compression algorithm (default: blosc, i.e. Blosc LZ4 with byte shuffle)",
     )
     parser.add_argument(
         "--compression-level",
         type=int,
-        default=4,
+        default=None,
         choices=range(0, 10),
         metavar="[0-9]",
-        help="Compression level for gzip (default: 4)",
+        help="Compression level (default: 1 for gzip, 5 for Blosc codecs)",
+    )
+    parser.add_argument(
+        "--dtype",
+        choices=["auto", "float32", "float64"],
+        default="auto",
+        help="Type to store floating point arrays with (default: auto, keep the "
+        "type of the input; float32 halves the output of float64 data)",
     )
 
     parser.add_argument(
@@ -94,7 +105,7 @@ Examples:
         type=int,
         default=0,
         metavar="N",
-        help="Number of parallel jobs for reading VTS files (default: 0 for auto, use 1 for sequential)",
+        help="Number of parallel jobs for reading VTS files (default: 0 for one per physical core, use 1 for sequential)",
     )
 
     parser.add_argument(
@@ -111,15 +122,15 @@ Examples:
     return parser.parse_args()
 
 
-def find_vts_files(folder: Path) -> list[Path]:
+def _vts_entries(folder: Path) -> list[os.DirEntry]:
     """
-    Find all VTS files in a folder.
+    List the directory entries of all VTS files in a folder.
 
     Args:
         folder: Folder path to search
 
     Returns:
-        Sorted list of Path objects
+        List of directory entries sorted by step number
     """
     if not folder.exists():
         print(f"Error: Folder not found: {folder}", file=sys.stderr)
@@ -129,41 +140,75 @@ def find_vts_files(folder: Path) -> list[Path]:
         print(f"Error: Not a folder: {folder}", file=sys.stderr)
         sys.exit(1)
 
-    files = list(folder.glob("*.vts"))
+    from vts2h5.converter import parse_step_number
+
+    # normcase keeps the match case-insensitive on Windows, like glob.
+    # is_file() answers from the dirent type except for symlinks, which are
+    # followed so that linked files are still found
+    with os.scandir(folder) as entries:
+        files = [
+            entry
+            for entry in entries
+            if os.path.normcase(entry.name).endswith(".vts") and entry.is_file()
+        ]
 
     if not files:
         print(f"Error: No VTS files found in {folder}", file=sys.stderr)
         sys.exit(1)
 
     # Sort files numerically by step number
-    def get_step_number(filepath: Path) -> int:
-        match = re.search(r"step[_\s]*(\d+)", filepath.stem)
-        return int(match.group(1)) if match else 0
-
-    files.sort(key=get_step_number)
+    files.sort(key=lambda entry: parse_step_number(Path(entry.name).stem) or 0)
     return files
 
 
+def scan_vts_files(folder: Path) -> list[tuple[Path, int]]:
+    """
+    Find all VTS files in a folder together with their sizes.
+
+    The size comes from the directory listing on Windows and from one
+    stat() per file elsewhere.
+
+    Args:
+        folder: Folder path to search
+
+    Returns:
+        List of (path, size in bytes) tuples sorted by step number
+    """
+    return [(Path(entry.path), entry.stat().st_size) for entry in _vts_entries(folder)]
+
+
+def find_vts_files(folder: Path) -> list[Path]:
+    """
+    Find all VTS files in a folder.
+
+    Args:
+        folder: Folder path to search
+
+    Returns:
+        Sorted list of Path objects
+    """
+    return [Path(entry.path) for entry in _vts_entries(folder)]
+
+
 def display_folder_info(folder: Path) -> None:
     """Display information about VTS files in a folder as a time series."""
-    from vts2h5.converter import extract_time_steps
-    from vts2h5.reader import VTSReader
+    from vts2h5.converter import extract_time_steps, read_vts_info_worker
 
-    files = find_vts_files(folder)
+    scanned = scan_vts_files(folder)
+    files = [path for path, _ in scanned]
 
     print(f"\nFolder: {folder}")
     print(f"VTS files: {len(files)}")
 
-    # Read first file to get grid information
+    # Read the first file's header to get grid information
     try:
-        reader = VTSReader(str(files[0]))
-        info = reader.get_info()
+        info = read_vts_info_worker(str(files[0]))
 
         # Extract time steps from filenames
         time_steps = extract_time_steps(files)
 
         # Calculate total original size
-        total_size = sum(f.stat().st_size for f in files)
+        total_size = sum(size for _, size in scanned)
 
         print("\nTime Series Information:")
         print(
@@ -192,10 +237,11 @@ def convert_folder(
     output_file: Path,
     xdmf_output: Path,
     compression: str,
-    compression_level: int,
+    compression_level: Optional[int],
     silent: bool,
     verbose: bool,
     jobs: int = 0,
+    dtype: str = "auto",
 ) -> None:
     """Convert all VTS files in a folder to HDF5 as a time series."""
     from vts2h5.converter import convert_vts_to_hdf5
@@ -210,6 +256,7 @@ def convert_folder(
         jobs=jobs,
         silent=silent,
         verbose=verbose,
+        output_dtype=None if dtype == "auto" else dtype,
     )
 
     # Display results
@@ -299,6 +346,7 @@ def main():
         args.silent,
         args.verbose,
         args.jobs,
+        args.dtype,
     )
 
 
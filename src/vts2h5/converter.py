@@ -1,19 +1,79 @@
 """VTS to HDF5 converter module."""
 
+import os
+import queue
 import re
 import sys
-import xml.etree.ElementTree as ET
-from multiprocessing import Pool, cpu_count
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from math import prod
+from multiprocessing import cpu_count, get_context, resource_tracker
+from multiprocessing.pool import Pool
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple, NoReturn, Optional
 
+# Step number embedded in VTS file names, e.g. "scalar_variables_step100"
+_STEP_RE = re.compile(r"step[_\s]*(\d+)")
 
-def read_vts_file_worker(filepath: str) -> tuple[dict, int]:
+# Named shared memory outlives its creator only on POSIX; on Windows the block
+# is freed as soon as the worker closes it, so arrays are pickled instead
+USE_SHARED_MEMORY = os.name == "posix"
+
+
+class SharedArray(NamedTuple):
+    """Descriptor of a numpy array copied into a shared memory block."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+def advise_file(filepath: str, advice_name: str) -> None:
+    """
+    Give the kernel an access-pattern hint for a whole file, where supported.
+
+    Args:
+        filepath: Path to the file
+        advice_name: Name of an ``os.POSIX_FADV_*`` constant
+    """
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def read_vts_file_worker(
+    filepath: str,
+    precompress_level: Optional[int] = None,
+    geometry: bool = True,
+    output_dtype: Optional[str] = None,
+) -> tuple[dict, int]:
     """
     Worker function to read a VTS file in parallel with validation.
 
     Args:
         filepath: Path to VTS file
+        precompress_level: If given, also gzip-compress the arrays chunk by
+            chunk into ``grid_data["encoded_chunks"]`` (see
+            ``HDF5Writer.precompress_level``), using the worker's CPU instead
+            of the writer's
+        geometry: If False, leave the point coordinates out of grid_data;
+            they are as large as three scalar arrays and the same for every
+            step of a time series
+        output_dtype: ``output_dtype`` of the target writer, used when
+            precompressing
 
     Returns:
         Tuple of (grid_data, file_size)
@@ -23,12 +83,20 @@ def read_vts_file_worker(filepath: str) -> tuple[dict, int]:
     """
     from pathlib import Path
 
+    from lxml import etree
+
     from vts2h5.reader import VTSReader
 
-    # Validate XML structure
+    # Start read-ahead of the whole file into the page cache; the hint is
+    # per inode, so the validation pass and VTK benefit from it
+    advise_file(filepath, "POSIX_FADV_WILLNEED")
+
+    # Validate XML structure, streaming so no tree is built; huge_tree lifts
+    # libxml2's 10 MB limit on text nodes, which inline VTS data exceeds
     try:
-        ET.parse(filepath)
-    except ET.ParseError as e:
+        for _, element in etree.iterparse(filepath, events=("end",), huge_tree=True):
+            element.clear()
+    except etree.XMLSyntaxError as e:
         raise ValueError(f"Corrupted XML in {Path(filepath).name}: {str(e)}") from e
 
     # Read VTS file
@@ -36,10 +104,259 @@ def read_vts_file_worker(filepath: str) -> tuple[dict, int]:
         reader = VTSReader(filepath)
         grid_data = reader.read()
         file_size = Path(filepath).stat().st_size
-        return grid_data, file_size
     except Exception as e:
         raise ValueError(f"Failed to read {Path(filepath).name}: {str(e)}") from e
 
+    if not geometry:
+        del grid_data["points"]
+
+    if precompress_level is not None:
+        from vts2h5.writer import encode_time_slab
+
+        grid_data["encoded_chunks"] = encode_time_slab(
+            grid_data, precompress_level, output_dtype
+        )
+
+    # Each file is read exactly once; drop its pages instead of letting a
+    # long series push everything else out of the page cache
+    advise_file(filepath, "POSIX_FADV_DONTNEED")
+    return grid_data, file_size
+
+
+def peek_dimensions(filepath: str) -> Optional[list[int]]:
+    """
+    Read the grid dimensions from the StructuredGrid header of a VTS file.
+
+    Parsing stops at the first StructuredGrid element, so none of the data
+    arrays are read or decoded.
+
+    Args:
+        filepath: Path to VTS file
+
+    Returns:
+        Dimensions as [nx, ny, nz], or None if the header cannot be read
+    """
+    from lxml import etree
+
+    try:
+        for _, element in etree.iterparse(
+            filepath, events=("start",), tag="StructuredGrid", huge_tree=True
+        ):
+            extent = [int(v) for v in element.get("WholeExtent", "").split()]
+            break
+        else:
+            return None
+    except (etree.XMLSyntaxError, OSError, ValueError):
+        return None
+
+    if len(extent) != 6:
+        return None
+    return [extent[i + 1] - extent[i] + 1 for i in range(0, 6, 2)]
+
+
+def read_vts_info_worker(filepath: str) -> dict[str, Any]:
+    """
+    Worker function to read a VTS file's summary from its XML header only.
+
+    Array names are taken from the first piece and counts from its extent,
+    so no data array is decoded; suited to ``--info`` style listings.
+
+    Args:
+        filepath: Path to VTS file
+
+    Returns:
+        Dictionary with filepath, dimensions, num_points, num_cells,
+        point_arrays, cell_arrays and file_size
+
+    Raises:
+        ValueError if the header cannot be parsed
+    """
+    from lxml import etree
+
+    dimensions = None
+    arrays: dict[str, list[str]] = {"PointData": [], "CellData": []}
+    section = None
+
+    try:
+        for event, element in etree.iterparse(
+            filepath,
+            events=("start", "end"),
+            tag=("StructuredGrid", "PointData", "CellData", "DataArray", "Points"),
+            huge_tree=True,
+        ):
+            tag = element.tag
+            if tag == "Points":
+                break
+            if event == "end":
+                section = None if tag == section else section
+                element.clear()
+            elif tag == "StructuredGrid":
+                extent = [int(v) for v in element.get("WholeExtent", "").split()]
+                dimensions = [extent[i + 1] - extent[i] + 1 for i in range(0, 6, 2)]
+            elif tag in arrays:
+                section = tag
+            elif section is not None:
+                arrays[section].append(element.get("Name", ""))
+    except (etree.XMLSyntaxError, ValueError, IndexError) as e:
+        raise ValueError(f"Failed to read {Path(filepath).name}: {e}") from e
+
+    if dimensions is None:
+        raise ValueError(f"Failed to read {Path(filepath).name}: no StructuredGrid")
+
+    # VTK counts cells only along axes with more than one point
+    cell_dims = [n - 1 for n in dimensions if n > 1]
+    return {
+        "filepath": filepath,
+        "dimensions": dimensions,
+        "num_points": prod(dimensions),
+        "num_cells": prod(cell_dims) if cell_dims else 0,
+        "point_arrays": arrays["PointData"],
+        "cell_arrays": arrays["CellData"],
+        "file_size": os.stat(filepath).st_size,
+    }
+
+
+def read_vts_file_shared_worker(
+    filepath: str,
+    precompress_level: Optional[int] = None,
+    geometry: bool = True,
+    output_dtype: Optional[str] = None,
+) -> tuple[dict, int]:
+    """
+    Worker function to read a VTS file and hand its arrays over in shared memory.
+
+    Only small ``SharedArray`` descriptors travel back through the pool's pipe;
+    the parent maps the blocks with ``attach_shared_arrays``.
+
+    Args:
+        filepath: Path to VTS file
+        precompress_level: Passed on to ``read_vts_file_worker``
+        geometry: Passed on to ``read_vts_file_worker``
+        output_dtype: Passed on to ``read_vts_file_worker``
+
+    Returns:
+        Tuple of (grid_data with arrays replaced by SharedArray, file_size)
+    """
+    grid_data, file_size = read_vts_file_worker(
+        filepath, precompress_level, geometry, output_dtype
+    )
+    return export_shared_arrays(grid_data), file_size
+
+
+def export_shared_arrays(grid_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Copy the arrays of a grid into shared memory blocks.
+
+    Args:
+        grid_data: Grid data dictionary from VTSReader
+
+    Returns:
+        Copy of grid_data with points, point_data and cell_data arrays replaced
+        by SharedArray descriptors
+    """
+    import numpy as np
+
+    blocks = []
+
+    def share(array) -> SharedArray:
+        array = np.ascontiguousarray(array)
+        block = SharedMemory(create=True, size=max(1, array.nbytes))
+        blocks.append(block)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        return SharedArray(block.name, array.shape, array.dtype.str)
+
+    try:
+        shared = dict(grid_data)
+        if "points" in grid_data:
+            shared["points"] = share(grid_data["points"])
+        for key in ("point_data", "cell_data"):
+            shared[key] = {name: share(arr) for name, arr in grid_data[key].items()}
+    except BaseException:
+        for block in blocks:
+            block.close()
+            block.unlink()
+        raise
+
+    # The parent owns the blocks from here on and unlinks them
+    for block in blocks:
+        block.close()
+    return shared
+
+
+def attach_shared_arrays(
+    grid_data: dict[str, Any],
+) -> tuple[dict[str, Any], list[SharedMemory]]:
+    """
+    Map the shared memory blocks of an exported grid as numpy arrays.
+
+    Block names are unlinked right away, so they cannot leak even if the
+    conversion is interrupted; the memory itself stays mapped until
+    ``release_shared_arrays`` is called.
+
+    Args:
+        grid_data: Grid data dictionary from ``export_shared_arrays``
+
+    Returns:
+        Tuple of (grid_data with numpy arrays, list of attached blocks)
+    """
+    import numpy as np
+
+    blocks = []
+
+    def attach(shared: SharedArray):
+        block = SharedMemory(name=shared.name)
+        block.unlink()
+        blocks.append(block)
+        return np.ndarray(shared.shape, dtype=shared.dtype, buffer=block.buf)
+
+    attached = dict(grid_data)
+    if "points" in grid_data:
+        attached["points"] = attach(grid_data["points"])
+    for key in ("point_data", "cell_data"):
+        attached[key] = {name: attach(arr) for name, arr in grid_data[key].items()}
+    return attached, blocks
+
+
+def release_shared_arrays(
+    grid_data: dict[str, Any], blocks: list[SharedMemory]
+) -> None:
+    """
+    Drop the arrays of an attached grid and unmap its shared memory blocks.
+
+    Args:
+        grid_data: Grid data dictionary from ``attach_shared_arrays``
+        blocks: Blocks returned by ``attach_shared_arrays``
+    """
+    # Clear in place so no array views remain when the blocks are closed
+    grid_data.pop("points", None)
+    grid_data["point_data"].clear()
+    grid_data["cell_data"].clear()
+    for block in blocks:
+        block.close()
+
+
+def parse_step_number(stem: str) -> Optional[int]:
+    """
+    Extract the step number from a VTS file name stem.
+
+    Args:
+        stem: File name without extension, e.g. "scalar_variables_step100"
+
+    Returns:
+        Step number, or None if the name carries none
+    """
+    start = stem.find("step")
+    if start < 0:
+        return None
+
+    # Usual case: the name ends in "step<digits>", no regex needed
+    tail = stem[start + 4 :].lstrip("_ \t\n\r\f\v")
+    if tail.isdecimal():
+        return int(tail)
+
+    match = _STEP_RE.search(stem, start)
+    return int(match.group(1)) if match else None
+
 
 def extract_time_steps(input_files: list[Path]) -> list[int]:
     """
@@ -51,26 +368,280 @@ def extract_time_steps(input_files: list[Path]) -> list[int]:
     Returns:
         List of time step numbers
     """
-    time_steps = []
-    for i, f in enumerate(input_files):
-        match = re.search(r"step[_\s]*(\d+)", f.stem)
-        if match:
-            time_steps.append(int(match.group(1)))
-        else:
-            # Use file index if no step number found
-            time_steps.append(i)
-    return time_steps
+    # Use file index if no step number found
+    return [
+        step if (step := parse_step_number(f.stem)) is not None else i
+        for i, f in enumerate(input_files)
+    ]
+
+
+def default_jobs() -> int:
+    """
+    Number of workers to use when none is given.
+
+    XML parsing and array decoding gain little from hyper-threading, so this
+    counts physical cores when psutil is available, within the CPUs the
+    process may run on.
+
+    Returns:
+        Number of worker processes
+    """
+    if hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0))
+    else:
+        available = cpu_count()
+
+    try:
+        import psutil
+
+        physical = psutil.cpu_count(logical=False)
+    except ImportError:
+        physical = None
+
+    return max(1, min(physical or available, available))
+
+
+def _init_worker() -> None:
+    """Prepare a worker: single-threaded numerical libraries, VTK imported once."""
+    # Spawned workers have not imported numpy yet, so this still takes effect
+    for variable in ["OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"]:
+        os.environ.setdefault(variable, "1")
+
+    # Pay for the VTK import while the pool starts, not on the first file
+    import vts2h5.reader  # noqa: F401
+
+
+def create_pool(num_jobs: int) -> Pool:
+    """
+    Create the worker pool used to read VTS files.
+
+    Args:
+        num_jobs: Number of worker processes
+
+    Returns:
+        Worker pool
+    """
+    if USE_SHARED_MEMORY:
+        # Workers must share the parent's resource tracker, or each one would
+        # try to clean up the shared memory blocks the parent already unlinked
+        resource_tracker.ensure_running()
+    # Spawned workers start from a fresh interpreter instead of a copy of the
+    # parent, which may hold VTK, an open HDF5 file and a reader thread
+    context = get_context("spawn")
+    return context.Pool(processes=num_jobs, initializer=_init_worker)
+
+
+def iter_grids_sequential(
+    file_paths: list[str],
+    prefetch: int = 2,
+    precompress_level: Optional[int] = None,
+    output_dtype: Optional[str] = None,
+) -> Iterator[tuple[int, dict, int]]:
+    """
+    Read VTS files one after another in a background thread.
+
+    VTK parsing releases the GIL, so the next file is read while the consumer
+    compresses and writes the current one, and the page cache is asked to load
+    the file after it meanwhile. At most ``prefetch`` grids wait in memory;
+    HDF5 access stays on the consumer's thread.
+
+    Args:
+        file_paths: List of VTS file paths
+        prefetch: Maximum number of grids read ahead of the consumer
+        precompress_level: If given, compress the arrays for ``HDF5Writer``
+            direct chunk writes at this gzip level in a second background
+            thread; zlib releases the GIL, so reading file i+1, compressing
+            file i and writing file i-1 overlap
+        output_dtype: ``output_dtype`` of the target writer, used when
+            precompressing
+
+    Yields:
+        Tuples of (file_index, grid_data, file_size) in input order
+    """
+    from vts2h5.writer import encode_time_slab
+
+    results: queue.Queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def read_ahead() -> None:
+        for index, filepath in enumerate(file_paths):
+            # Let the kernel fetch the next file while this one is parsed
+            if index + 1 < len(file_paths):
+                advise_file(file_paths[index + 1], "POSIX_FADV_WILLNEED")
+            try:
+                # Only the first grid's points are used
+                item = (index, *read_vts_file_worker(filepath, geometry=index == 0))
+            except BaseException as e:  # re-raised in the consumer
+                item = e
+            # Poll so that an abandoned consumer does not block the thread
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if stop.is_set() or isinstance(item, BaseException):
+                return
+
+    def encoded(item: tuple[int, dict, int], future: Future) -> tuple[int, dict, int]:
+        item[1]["encoded_chunks"] = future.result()
+        return item
+
+    reader = threading.Thread(target=read_ahead, name="vts-reader", daemon=True)
+    reader.start()
+    encoder = None
+    if precompress_level is not None:
+        encoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vts-encoder")
+    pending = None
+    try:
+        for _ in file_paths:
+            item = results.get()
+            future = None
+            if encoder is not None and not isinstance(item, BaseException):
+                future = encoder.submit(
+                    encode_time_slab, item[1], precompress_level, output_dtype
+                )
+            # Hand out the previous grid while this one is being compressed
+            if pending is not None:
+                yield encoded(*pending)
+                pending = None
+            if isinstance(item, BaseException):
+                raise item
+            if future is None:
+                yield item
+            else:
+                pending = (item, future)
+        if pending is not None:
+            yield encoded(*pending)
+    finally:
+        stop.set()
+        reader.join()
+        if encoder is not None:
+            encoder.shutdown(cancel_futures=True)
+
+
+def iter_grids_parallel(
+    pool: Pool,
+    file_paths: list[str],
+    window: int,
+    precompress_level: Optional[int] = None,
+    output_dtype: Optional[str] = None,
+) -> Iterator[tuple[int, dict, int]]:
+    """
+    Read VTS files in a worker pool, yielding them in input order.
+
+    At most ``window`` files are read ahead of the consumer, so memory stays
+    bounded by the window instead of the number of files, and the consumer
+    can write one file while the workers decode the next ones. On POSIX the
+    arrays arrive through shared memory and are only valid until the consumer
+    asks for the next grid.
+
+    Args:
+        pool: Worker pool used to read the files
+        file_paths: List of VTS file paths
+        window: Maximum number of files in flight or waiting to be consumed
+        precompress_level: If given, workers also compress the arrays for
+            ``HDF5Writer`` direct chunk writes at this gzip level
+        output_dtype: ``output_dtype`` of the target writer, used when
+            precompressing
+
+    Yields:
+        Tuples of (file_index, grid_data, file_size) in input order
+    """
+    worker = read_vts_file_shared_worker if USE_SHARED_MEMORY else read_vts_file_worker
+    pending = {}
+    next_index = 0
+
+    try:
+        for index in range(len(file_paths)):
+            # Keep the window full; results arriving out of order wait in
+            # their AsyncResult until their turn comes
+            while next_index < len(file_paths) and next_index < index + window:
+                # Points are only needed from the first file, the others
+                # skip copying them into shared memory and through the pipe
+                pending[next_index] = pool.apply_async(
+                    worker,
+                    (
+                        file_paths[next_index],
+                        precompress_level,
+                        next_index == 0,
+                        output_dtype,
+                    ),
+                )
+                next_index += 1
+
+            grid_data, file_size = pending.pop(index).get()
+            if not USE_SHARED_MEMORY:
+                yield index, grid_data, file_size
+                continue
+
+            grid_data, blocks = attach_shared_arrays(grid_data)
+            try:
+                yield index, grid_data, file_size
+            finally:
+                release_shared_arrays(grid_data, blocks)
+    finally:
+        # Unlink blocks of files that were read but never consumed
+        if USE_SHARED_MEMORY:
+            for result in pending.values():
+                if result.ready() and result.successful():
+                    release_shared_arrays(*attach_shared_arrays(result.get()[0]))
+
+
+def summarize_grid(grid_data: dict[str, Any], filepath: str) -> dict[str, Any]:
+    """
+    Build the summary of ``VTSReader.get_info`` from an already loaded grid.
+
+    Args:
+        grid_data: Grid data dictionary from VTSReader.read
+        filepath: Path of the file the grid was read from
+
+    Returns:
+        Dictionary with file information
+    """
+    points = grid_data["points"]
+    if len(points):
+        lower, upper = points.min(axis=0), points.max(axis=0)
+        bounds = [float(v) for pair in zip(lower, upper) for v in pair]
+    else:
+        bounds = [0.0] * 6
+
+    return {
+        "filepath": filepath,
+        "dimensions": list(grid_data["dimensions"]),
+        "num_points": grid_data["num_points"],
+        "num_cells": grid_data["num_cells"],
+        "bounds": bounds,
+        "point_arrays": list(grid_data["point_data"]),
+        "cell_arrays": list(grid_data["cell_data"]),
+    }
+
+
+def _abort_conversion(writer, output_file: Path, *messages: str) -> NoReturn:
+    """Report a failed conversion, remove the partial output and exit."""
+    for message in messages:
+        print(message, file=sys.stderr)
+    # Only a file the writer has opened (and so truncated) is partial output;
+    # one left by an earlier run is kept when the run fails before that
+    if writer.file is not None:
+        print("Conversion aborted. Cleaning up partial output...", file=sys.stderr)
+        writer.close()
+        output_file.unlink(missing_ok=True)
+    else:
+        print("Conversion aborted.", file=sys.stderr)
+    sys.exit(1)
 
 
 def convert_vts_to_hdf5(
     input_files: list[Path],
     output_file: Path,
     xdmf_output: Path,
-    compression: str = "gzip",
-    compression_level: int = 4,
+    compression: str = "blosc",
+    compression_level: Optional[int] = None,
     jobs: int = 0,
     silent: bool = False,
     verbose: bool = False,
+    output_dtype: Optional[str] = None,
 ) -> dict[str, Any]:
     """
     Convert VTS files to HDF5 with XDMF2 descriptor.
@@ -79,11 +650,14 @@ def convert_vts_to_hdf5(
         input_files: List of VTS file paths
         output_file: Output HDF5 file path
         xdmf_output: Output XDMF2 file path
-        compression: Compression algorithm (gzip, lzf, none)
-        compression_level: Compression level for gzip (0-9)
+        compression: Compression algorithm (blosc, blosclz4hc, zstd, gzip, lzf,
+            none)
+        compression_level: Compression level (0-9), None for the algorithm default
         jobs: Number of parallel workers (0 for auto)
         silent: Suppress all output
         verbose: Show detailed information
+        output_dtype: Floating point dtype to store floating point arrays
+            with (e.g. "float32"), None to keep the input dtype
 
     Returns:
         Dictionary with conversion statistics
@@ -93,19 +667,22 @@ def convert_vts_to_hdf5(
     """
     from tqdm import tqdm
 
-    from vts2h5.reader import VTSReader
-    from vts2h5.writer import HDF5Writer
+    from vts2h5.writer import (
+        HDF5Writer,
+        array_components,
+        grid_geometry,
+        xdmf_precision,
+    )
     from vts2h5.xdmf import XDMFGenerator
 
     try:
-        comp = None if compression == "none" else compression
-        comp_opts = None if compression == "none" else compression_level
-        writer = HDF5Writer(
-            str(output_file), compression=comp, compression_opts=comp_opts
-        )
-
         total_original_size = 0
-        first_grid_data = None
+        reference_dims = None
+        origin = spacing = None
+        precision = 8
+        point_arrays: list[str] = []
+        cell_arrays: list[str] = []
+        components: dict[str, int] = {}
         first_grid_info = None
 
         # Extract time steps from filenames
@@ -113,137 +690,122 @@ def convert_vts_to_hdf5(
 
         # Determine number of processes
         if jobs == 0:
-            num_jobs = cpu_count()
+            num_jobs = default_jobs()
         else:
             num_jobs = max(1, jobs)
+        num_jobs = min(num_jobs, len(input_files))
 
         use_multiprocessing = num_jobs > 1 and len(input_files) > 1
 
+        # gzip chunks are compressed by the workers in parallel mode, and by
+        # the read-ahead thread otherwise, never on the writing thread
+        comp = None if compression == "none" else compression
+        comp_opts = None if compression == "none" else compression_level
+        writer = HDF5Writer(
+            str(output_file),
+            compression=comp,
+            compression_opts=comp_opts,
+            direct_chunks=True,
+            output_dtype=output_dtype,
+        )
+
         if use_multiprocessing and not silent:
             print(
                 f"Reading {len(input_files)} VTS files with {num_jobs} parallel workers..."
             )
 
-        # Read VTS files (parallel if jobs > 1)
-        if use_multiprocessing:
-            file_paths = [str(f) for f in input_files]
+        file_paths = [str(f) for f in input_files]
+
+        # Check all headers before decoding any data, so a mismatch in the
+        # last file does not cost a full read of all the others
+        header_dims = [peek_dimensions(path) for path in file_paths]
+        expected_dims = header_dims[0]
+        for path, dims in zip(input_files, header_dims):
+            if expected_dims is not None and dims is not None and dims != expected_dims:
+                _abort_conversion(
+                    writer,
+                    output_file,
+                    f"\n✗ Dimension mismatch in {path.name}!",
+                    f"  Expected: {expected_dims}, Got: {dims}",
+                )
 
-            try:
-                with Pool(processes=num_jobs) as pool:
-                    if silent:
-                        results = pool.map(read_vts_file_worker, file_paths)
-                    else:
-                        results = list(
-                            tqdm(
-                                pool.imap(read_vts_file_worker, file_paths),
-                                total=len(file_paths),
-                                desc="Reading files",
-                                unit="file",
-                            )
-                        )
-            except Exception as e:
-                print(f"\n✗ Error reading files: {e}", file=sys.stderr)
-                print("Conversion aborted. No files were written.", file=sys.stderr)
-                sys.exit(1)
-
-            # Unpack results and validate consistency
-            grid_data_list = [r[0] for r in results]
-            file_sizes = [r[1] for r in results]
-            total_original_size = sum(file_sizes)
-
-            first_grid_data = grid_data_list[0]
-            reference_dims = first_grid_data["dimensions"]
-
-            # Validate all files have same dimensions
-            for i, grid_data in enumerate(grid_data_list[1:], 1):
-                if grid_data["dimensions"] != reference_dims:
-                    print(
-                        f"\n✗ Dimension mismatch in {input_files[i].name}!",
-                        file=sys.stderr,
-                    )
-                    print(
-                        f"  Expected: {reference_dims}, Got: {grid_data['dimensions']}",
-                        file=sys.stderr,
-                    )
-                    print("Conversion aborted. No files were written.", file=sys.stderr)
-                    sys.exit(1)
-
-            if verbose:
-                reader = VTSReader(str(input_files[0]))
-                first_grid_info = reader.get_info()
-
-            # Write to HDF5 (sequential, HDF5 is not thread-safe)
-            if not silent:
-                print("Writing to HDF5...")
+        with ExitStack() as stack:
+            # Read VTS files (parallel if jobs > 1) and write each one as soon
+            # as it arrives (sequential, HDF5 is not thread-safe)
+            if use_multiprocessing:
+                pool = stack.enter_context(create_pool(num_jobs))
+                grids = iter_grids_parallel(
+                    pool,
+                    file_paths,
+                    window=2 * num_jobs,
+                    precompress_level=writer.precompress_level,
+                    output_dtype=output_dtype,
+                )
+            else:
+                grids = iter_grids_sequential(
+                    file_paths,
+                    precompress_level=writer.precompress_level,
+                    output_dtype=output_dtype,
+                )
 
-            iterator = enumerate(grid_data_list)
             if not silent:
-                iterator = tqdm(
-                    iterator,
-                    total=len(grid_data_list),
-                    desc="Writing to HDF5",
+                # Redraw at most every 0.2 s / 0.5 % so long series of small
+                # files do not spend their time writing to the terminal
+                grids = tqdm(
+                    grids,
+                    total=len(file_paths),
+                    desc="Converting files",
                     unit="file",
+                    mininterval=0.2,
+                    miniters=max(1, len(file_paths) // 200),
                 )
 
-            for i, grid_data in iterator:
-                writer.write(grid_data, time_step=time_steps[i])
-
-        else:
-            # Sequential processing
-            iterator = (
-                input_files
-                if silent
-                else tqdm(input_files, desc="Converting files", unit="file")
-            )
-            reference_dims = None
-
             try:
-                for i, input_file in enumerate(iterator):
-                    reader = VTSReader(str(input_file))
-                    grid_data = reader.read()
-
+                for i, grid_data, file_size in grids:
                     if i == 0:
-                        first_grid_data = grid_data
                         reference_dims = grid_data["dimensions"]
+                        point_arrays = list(grid_data["point_data"])
+                        cell_arrays = list(grid_data["cell_data"])
+                        components = array_components(grid_data)
+                        if "bounds" in grid_data:
+                            origin, spacing = grid_geometry(grid_data)
+                        precision = xdmf_precision(grid_data, output_dtype)
                         if verbose:
-                            first_grid_info = reader.get_info()
-                    else:
-                        # Validate dimensions consistency
-                        if grid_data["dimensions"] != reference_dims:
-                            print(
-                                f"\n✗ Dimension mismatch in {input_file.name}!",
-                                file=sys.stderr,
-                            )
-                            print(
-                                f"  Expected: {reference_dims}, Got: {grid_data['dimensions']}",
-                                file=sys.stderr,
-                            )
-                            print(
-                                "Conversion aborted. Cleaning up partial output...",
-                                file=sys.stderr,
-                            )
-                            writer.close()
-                            if output_file.exists():
-                                output_file.unlink(missing_ok=True)
-                            sys.exit(1)
-
-                    writer.write(grid_data, time_step=time_steps[i])
-                    total_original_size += input_file.stat().st_size
+                            first_grid_info = summarize_grid(grid_data, file_paths[0])
+                        # All N time steps are known now, so every dataset
+                        # is allocated once at its final size
+                        writer.init_time_series(grid_data, time_steps)
+                    elif grid_data["dimensions"] != reference_dims:
+                        # Validate dimensions consistency; headers that could
+                        # not be peeked at are only checked here
+                        _abort_conversion(
+                            writer,
+                            output_file,
+                            f"\n✗ Dimension mismatch in {input_files[i].name}!",
+                            f"  Expected: {reference_dims}, Got: {grid_data['dimensions']}",
+                        )
+
+                    try:
+                        writer.write(grid_data, time_step_index=i)
+                    except ValueError as e:
+                        # Arrays differing from the first file's
+                        _abort_conversion(
+                            writer,
+                            output_file,
+                            f"\n✗ Array mismatch in {input_files[i].name}!",
+                            f"  {e}",
+                        )
+                    total_original_size += file_size
 
             except Exception as e:
-                print(f"\n✗ Error reading {input_file.name}: {e}", file=sys.stderr)
-                print(
-                    "Conversion aborted. Cleaning up partial output...", file=sys.stderr
+                _abort_conversion(
+                    writer, output_file, f"\n✗ Error converting files: {e}"
                 )
-                writer.close()
-                if output_file.exists():
-                    output_file.unlink(missing_ok=True)
-                sys.exit(1)
 
         writer.close()
 
         # Generate XDMF descriptor
-        if first_grid_data:
+        if reference_dims is not None:
             if not silent:
                 print("Generating XDMF2 descriptor...")
 
@@ -251,10 +813,14 @@ def convert_vts_to_hdf5(
                 str(output_file),
                 str(xdmf_output),
                 time_steps=time_steps,
-                time_values=[float(s) for s in time_steps],
-                dimensions=first_grid_data["dimensions"],
-                point_arrays=list(first_grid_data["point_data"].keys()),
-                cell_arrays=list(first_grid_data["cell_data"].keys()),
+                dimensions=reference_dims,
+                point_arrays=point_arrays,
+                cell_arrays=cell_arrays,
+                time_series=True,
+                origin=origin,
+                spacing=spacing,
+                precision=precision,
+                components=components,
             )
 
         # Calculate statistics
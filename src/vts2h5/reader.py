@@ -1,12 +1,23 @@
 """VTS file reader module."""
 
-import xml.etree.ElementTree as ET
+import re
 from pathlib import Path
 from typing import Any, Optional
 
 import vtk
+from lxml import etree
 from vtkmodules.util import numpy_support
 
+# Bytes read to look for the root element before falling back to a parser
+HEADER_BYTES = 4096
+
+# Optional BOM, XML declaration and comments, then the VTKFile start tag
+_VTKFILE_ROOT = re.compile(
+    rb"\A(?:\xef\xbb\xbf)?\s*(?:(?:<\?.*?\?>|<!--.*?-->)\s*)*<VTKFile\b([^<>]*)>",
+    re.DOTALL,
+)
+_TYPE_ATTRIBUTE = re.compile(rb"""\stype\s*=\s*(["'])(.*?)\1""")
+
 
 class VTSReader:
     """Reader for VTK Structured Grid (VTS) files."""
@@ -21,17 +32,66 @@ class VTSReader:
         self.filepath = Path(filepath)
         if not self.filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
+        self._reader = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
+
+    def _get_output(self):
+        """
+        Parse the file once and return the VTK structured grid.
+
+        The VTK reader is kept, so ``get_info`` and ``read`` on the same
+        instance share a single parse of the file.
+        """
+        if self._reader is None:
+            reader = vtk.vtkXMLStructuredGridReader()
+            reader.SetFileName(str(self.filepath))
+            reader.Update()
+            self._reader = reader
+        return self._reader.GetOutput()
+
+    def close(self) -> None:
+        """Release the parsed grid; a later read parses the file again."""
+        self._reader = None
 
     def validate_xml(self) -> tuple[bool, Optional[str]]:
         """
-        Validate that the VTS file is well-formed XML.
+        Validate that the VTS file starts with a StructuredGrid VTKFile root.
+
+        Only the XML header up to the root element is parsed, so the check
+        costs the same for any file size; errors further into the file are
+        reported when it is read.
 
         Returns:
             Tuple of (is_valid, error_message)
         """
         try:
-            tree = ET.parse(str(self.filepath))
-            root = tree.getroot()
+            # Nearly every file is decided by a plain scan of its first bytes;
+            # the parser only runs for headers the scan cannot match
+            with open(self.filepath, "rb") as f:
+                head = f.read(HEADER_BYTES)
+            match = _VTKFILE_ROOT.match(head)
+            type_match = match and _TYPE_ATTRIBUTE.search(match.group(1))
+            if type_match:
+                vtk_type = type_match.group(2).decode(errors="replace")
+                if vtk_type != "StructuredGrid":
+                    return False, f"Not a StructuredGrid file (type is {vtk_type})"
+                return True, None
+
+            context = etree.iterparse(
+                str(self.filepath), events=("start",), huge_tree=True
+            )
+            try:
+                _, root = next(context)
+            finally:
+                del context
 
             # Check if it's a VTK file
             if root.tag != "VTKFile":
@@ -42,8 +102,8 @@ class VTSReader:
                 return False, f"Not a StructuredGrid file (type is {root.get('type')})"
 
             return True, None
-        except ET.ParseError as e:
-            return False, f"XML parse error: {str(e)}"
+        except (etree.XMLSyntaxError, StopIteration) as e:
+            return False, f"XML parse error: {str(e) or 'no root element'}"
         except Exception as e:
             return False, f"Validation error: {str(e)}"
 
@@ -51,6 +111,11 @@ class VTSReader:
         """
         Read VTS file and extract grid data.
 
+        The points and data arrays are zero-copy views of the VTK buffers,
+        which they keep alive on their own, so they stay valid after
+        ``close``. Reading again returns views of the same buffers until the
+        reader is closed; copy the arrays if they must be independent.
+
         Returns:
             Dictionary containing:
                 - dimensions: Grid dimensions (nx, ny, nz)
@@ -60,11 +125,7 @@ class VTSReader:
                 - metadata: Additional metadata
         """
         # Read VTS file
-        reader = vtk.vtkXMLStructuredGridReader()
-        reader.SetFileName(str(self.filepath))
-        reader.Update()
-
-        output = reader.GetOutput()
+        output = self._get_output()
 
         # Extract grid information
         dimensions = [0, 0, 0]
@@ -76,23 +137,9 @@ class VTSReader:
         points_vtk = output.GetPoints()
         points = numpy_support.vtk_to_numpy(points_vtk.GetData())
 
-        # Extract point data
-        point_data = {}
-        point_data_obj = output.GetPointData()
-        for i in range(point_data_obj.GetNumberOfArrays()):
-            array_name = point_data_obj.GetArrayName(i)
-            array_vtk = point_data_obj.GetArray(i)
-            array_numpy = numpy_support.vtk_to_numpy(array_vtk)
-            point_data[array_name] = array_numpy
-
-        # Extract cell data
-        cell_data = {}
-        cell_data_obj = output.GetCellData()
-        for i in range(cell_data_obj.GetNumberOfArrays()):
-            array_name = cell_data_obj.GetArrayName(i)
-            array_vtk = cell_data_obj.GetArray(i)
-            array_numpy = numpy_support.vtk_to_numpy(array_vtk)
-            cell_data[array_name] = array_numpy
+        # Extract point and cell data
+        point_data = _arrays_to_numpy(output.GetPointData())
+        cell_data = _arrays_to_numpy(output.GetCellData())
 
         # Get bounds and spacing if available
         bounds = list(output.GetBounds())
@@ -121,11 +168,7 @@ class VTSReader:
         Returns:
             Dictionary with file information
         """
-        reader = vtk.vtkXMLStructuredGridReader()
-        reader.SetFileName(str(self.filepath))
-        reader.Update()
-
-        output = reader.GetOutput()
+        output = self._get_output()
         point_data_obj = output.GetPointData()
         cell_data_obj = output.GetCellData()
 
@@ -152,3 +195,18 @@ class VTSReader:
         }
 
         return info
+
+
+def _arrays_to_numpy(attributes) -> dict[str, Any]:
+    """
+    Zero-copy numpy views of the numeric arrays of a vtkDataSetAttributes.
+
+    Non-numeric arrays (e.g. vtkStringArray) have no numpy view and cannot be
+    stored as HDF5 data, so they are skipped.
+    """
+    arrays = {}
+    for i in range(attributes.GetNumberOfArrays()):
+        array_vtk = attributes.GetArray(i)
+        if array_vtk is not None:
+            arrays[array_vtk.GetName()] = numpy_support.vtk_to_numpy(array_vtk)
+    return arrays
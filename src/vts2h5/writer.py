@@ -1,11 +1,340 @@
 """HDF5 file writer module."""
 
+import os
+import zlib
+from itertools import product
+from math import prod
 from pathlib import Path
 from typing import Any, Optional
 
 import h5py
+import hdf5plugin
 import numpy as np
 
+# Blosc-based compression names mapped to the Blosc codec they select
+BLOSC_CODECS = {"blosc": "lz4", "blosclz4hc": "lz4hc", "zstd": "zstd"}
+
+# Codecs that can be selected explicitly as "blosc:<codec>"
+BLOSC_CNAMES = ("blosclz", "lz4", "lz4hc", "snappy", "zlib", "zstd")
+
+# Compression levels used when none is given explicitly
+DEFAULT_COMPRESSION_LEVELS = {"gzip": 1, "blosc": 5, "blosclz4hc": 5, "zstd": 5}
+
+# Largest uncompressed chunk; a whole time step is one chunk unless it is bigger.
+# 1 MiB is HDF5's default chunk cache size, so readers such as ParaView keep a
+# chunk cached while they read the time steps it holds
+MAX_CHUNK_BYTES = 1024 * 1024
+
+# Raw-data chunk cache per open dataset; large enough to keep a chunk resident
+# while it is being filled, so it is compressed once instead of on each eviction
+CHUNK_CACHE_BYTES = 64 * 1024 * 1024
+# Number of cache hash slots, a prime well above the cached chunk count
+CHUNK_CACHE_SLOTS = 100003
+
+
+def chunk_shape(
+    shape: tuple[int, ...], itemsize: int, max_bytes: int = MAX_CHUNK_BYTES
+) -> tuple[int, ...]:
+    """
+    Pick a chunk shape that keeps one time step in as few chunks as possible.
+
+    XDMF readers load a time series one step at a time, so the whole array is
+    a single chunk when it fits in ``max_bytes``. Larger arrays are split along
+    their slowest-varying axes into contiguous slabs.
+
+    Args:
+        shape: Dataset shape, slowest-varying axis first (e.g. nz, ny, nx)
+        itemsize: Size of one element in bytes
+        max_bytes: Upper bound for the uncompressed chunk size
+
+    Returns:
+        Chunk shape
+    """
+    chunk = [max(1, n) for n in shape]
+    for axis in range(len(chunk)):
+        if prod(chunk) * itemsize <= max_bytes:
+            break
+        inner_bytes = prod(chunk[axis + 1 :]) * itemsize
+        chunk[axis] = max(1, min(chunk[axis], max_bytes // inner_bytes))
+    return tuple(chunk)
+
+
+def point_shape(dimensions) -> tuple[int, int, int]:
+    """Array shape of point data in Z, Y, X order for grid dimensions (nx, ny, nz)."""
+    nx, ny, nz = dimensions[0], dimensions[1], dimensions[2]
+    return (nz, ny, nx)
+
+
+def cell_shape(dimensions) -> tuple[int, int, int]:
+    """Array shape of cell data in Z, Y, X order for grid dimensions (nx, ny, nz)."""
+    nx, ny, nz = dimensions[0], dimensions[1], dimensions[2]
+    return (max(1, nz - 1), max(1, ny - 1), max(1, nx - 1))
+
+
+def grid_geometry(grid_data: dict[str, Any]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Origin and spacing of a uniform grid from its bounds and dimensions.
+
+    Args:
+        grid_data: Grid data with ``bounds`` and ``dimensions``
+
+    Returns:
+        Tuple of (origin, spacing) float64 arrays in X Y Z order; the spacing
+        along an axis with a single point is 0
+    """
+    bounds = np.asarray(grid_data["bounds"], dtype=np.float64)
+    dims = np.asarray(grid_data["dimensions"])
+    origin = bounds[0::2]
+    spacing = np.where(dims > 1, (bounds[1::2] - origin) / np.maximum(1, dims - 1), 0.0)
+    return origin, spacing
+
+
+def stored_dtype(dtype, output_dtype=None) -> np.dtype:
+    """
+    Dtype an array is stored with in HDF5.
+
+    Args:
+        dtype: Dtype of the array
+        output_dtype: Floating point dtype to store floating point arrays
+            with, None to keep their dtype; other arrays are never cast
+
+    Returns:
+        The dtype to store the array with
+    """
+    dtype = np.dtype(dtype)
+    if output_dtype is not None and np.issubdtype(dtype, np.floating):
+        return np.dtype(output_dtype)
+    return dtype
+
+
+def output_array(array, output_dtype=None) -> np.ndarray:
+    """Array cast to its ``stored_dtype``, without a copy if it already is."""
+    array = np.asarray(array)
+    return array.astype(stored_dtype(array.dtype, output_dtype), copy=False)
+
+
+def xdmf_precision(grid_data: dict[str, Any], output_dtype=None) -> int:
+    """
+    XDMF ``Precision`` of the stored arrays of a grid.
+
+    Args:
+        grid_data: Grid data dictionary from VTSReader
+        output_dtype: ``output_dtype`` of the writer
+
+    Returns:
+        4 if every floating point array is stored as float32, else 8
+    """
+    dtypes = [
+        np.asarray(array).dtype
+        for section in ("point_data", "cell_data")
+        for array in grid_data[section].values()
+    ]
+    sizes = {
+        stored_dtype(dtype, output_dtype).itemsize
+        for dtype in dtypes
+        if np.issubdtype(dtype, np.floating)
+    }
+    return 4 if sizes == {4} else 8
+
+
+def array_components(grid_data: dict[str, Any]) -> dict[str, int]:
+    """
+    Number of components of every array of a grid.
+
+    Args:
+        grid_data: Grid data dictionary from VTSReader
+
+    Returns:
+        Dictionary mapping dataset paths (``point_data/<name>``) to the number
+        of components, 1 for scalar arrays of shape (num_values,)
+    """
+    return {
+        f"{section}/{name}": prod(np.shape(array)[1:])
+        for section in ("point_data", "cell_data")
+        for name, array in grid_data[section].items()
+    }
+
+
+def _array_layout(grid_data: dict[str, Any]) -> tuple[list, dict[str, tuple]]:
+    """Grid dimensions and the shape of every array, keyed by dataset path."""
+    shapes = {
+        f"{section}/{name}": np.shape(array)
+        for section in ("point_data", "cell_data")
+        for name, array in grid_data[section].items()
+    }
+    return list(grid_data["dimensions"]), shapes
+
+
+def encode_chunks(array: np.ndarray, level: int) -> list[tuple[tuple[int, ...], bytes]]:
+    """
+    Compress an array chunk by chunk the way HDF5's shuffle and gzip filters
+    store it.
+
+    The chunk shape is ``chunk_shape(array.shape, ...)``, matching datasets
+    created with ``direct_chunks=True``, so the result can be handed to
+    ``write_direct_chunk`` without passing through the filter pipeline.
+
+    Args:
+        array: Array of one time step, in dataset order (e.g. nz, ny, nx)
+        level: Deflate level of the target dataset
+
+    Returns:
+        List of (chunk offset, compressed bytes) tuples
+    """
+    chunks = chunk_shape(array.shape, array.dtype.itemsize)
+    encoded = []
+    for offset in product(*(range(0, n, c) for n, c in zip(array.shape, chunks))):
+        block = array[tuple(slice(o, o + c) for o, c in zip(offset, chunks))]
+        if block.shape != chunks:
+            # HDF5 stores edge chunks at full size
+            padded = np.zeros(chunks, dtype=array.dtype)
+            padded[tuple(slice(0, n) for n in block.shape)] = block
+            block = padded
+        # Shuffle filter: byte 0 of every value, then byte 1, and so on
+        shuffled = np.ascontiguousarray(block).view(np.uint8)
+        shuffled = shuffled.reshape(-1, array.dtype.itemsize).T
+        data = zlib.compress(shuffled.tobytes(), level)
+        encoded.append((offset, data))
+    return encoded
+
+
+def encode_time_slab(
+    grid_data: dict[str, Any], level: int, output_dtype=None
+) -> dict[str, list[tuple[tuple[int, ...], bytes]]]:
+    """
+    Compress all arrays of one time step for ``HDF5Writer.write``.
+
+    Args:
+        grid_data: Grid data dictionary from VTSReader
+        level: Deflate level of the target datasets
+        output_dtype: ``output_dtype`` of the target writer
+
+    Returns:
+        Dictionary mapping dataset paths (``point_data/<name>``) to the
+        chunks from ``encode_chunks``
+    """
+    dims = grid_data["dimensions"]
+    sections = {"point_data": point_shape(dims), "cell_data": cell_shape(dims)}
+    encoded = {}
+    for section, spatial in sections.items():
+        for name, array in grid_data[section].items():
+            array = output_array(array, output_dtype)
+            array = array.reshape(*spatial, *array.shape[1:])
+            encoded[f"{section}/{name}"] = encode_chunks(array, level)
+    return encoded
+
+
+def blosc_codec(compression: Optional[str]) -> Optional[str]:
+    """
+    Blosc codec selected by a compression name.
+
+    Args:
+        compression: Compression name, e.g. 'blosc', 'zstd' or 'blosc:zstd'
+
+    Returns:
+        Blosc codec name, None if the compression does not use Blosc
+
+    Raises:
+        ValueError if a 'blosc:<codec>' name has an unknown codec
+    """
+    if compression is None:
+        return None
+    if compression.startswith("blosc:"):
+        cname = compression.split(":", 1)[1]
+        if cname not in BLOSC_CNAMES:
+            raise ValueError(
+                f"Unknown Blosc codec '{cname}', expected one of {', '.join(BLOSC_CNAMES)}"
+            )
+        return cname
+    return BLOSC_CODECS.get(compression)
+
+
+def default_compression_level(compression: Optional[str]) -> Optional[int]:
+    """Compression level used for a compression name when none is given."""
+    if compression is not None and compression.startswith("blosc:"):
+        return DEFAULT_COMPRESSION_LEVELS["blosc"]
+    return DEFAULT_COMPRESSION_LEVELS.get(compression)
+
+
+def write_step_shard(
+    vts_path: str,
+    shard_path: str,
+    compression: Optional[str],
+    compression_opts: Optional[int],
+    output_dtype=None,
+) -> dict[str, Any]:
+    """
+    Worker function to convert one VTS file into its own HDF5 file.
+
+    Runs in a worker process of ``HDF5Writer.write_multiple_parallel``; the
+    arrays are read, compressed and written there, without passing through
+    the parent process.
+
+    Args:
+        vts_path: Path to the VTS file
+        shard_path: Path of the HDF5 file to create
+        compression: Compression algorithm, as for ``HDF5Writer``
+        compression_opts: Compression level, as for ``HDF5Writer``
+        output_dtype: Floating point output dtype, as for ``HDF5Writer``
+
+    Returns:
+        Dictionary with the ``dimensions`` and ``bounds`` of the grid
+    """
+    from vts2h5.reader import VTSReader
+
+    grid_data = VTSReader(vts_path).read()
+    with HDF5Writer(
+        shard_path, compression, compression_opts, output_dtype=output_dtype
+    ) as writer:
+        writer.write(grid_data)
+    return {"dimensions": grid_data["dimensions"], "bounds": grid_data["bounds"]}
+
+
+def compression_kwargs(
+    compression: Optional[str], compression_opts: Optional[int] = None
+) -> dict[str, Any]:
+    """
+    Translate a compression name into ``create_dataset`` keyword arguments.
+
+    Blosc codecs are always combined with Blosc's byte shuffle, which groups
+    the bytes of floating point values and lets the fast LZ codecs reach
+    ratios close to gzip; gzip and LZF get HDF5's own shuffle filter for the
+    same reason.
+
+    Args:
+        compression: Compression name ('blosc', 'blosclz4hc', 'zstd',
+            'blosc:<codec>', 'gzip', 'lzf', or None)
+        compression_opts: Compression level (0-9), None for the default level
+
+    Returns:
+        Dictionary of keyword arguments for ``h5py.Group.create_dataset``
+    """
+    if compression is None:
+        return {}
+
+    if compression_opts is None:
+        compression_opts = default_compression_level(compression)
+
+    cname = blosc_codec(compression)
+    if cname is not None:
+        return dict(
+            hdf5plugin.Blosc(
+                cname=cname,
+                clevel=compression_opts,
+                shuffle=hdf5plugin.Blosc.SHUFFLE,
+            )
+        )
+
+    if compression == "lzf":
+        # LZF accepts no options
+        return {"compression": "lzf", "shuffle": True}
+
+    return {
+        "compression": compression,
+        "compression_opts": compression_opts,
+        "shuffle": compression == "gzip",
+    }
+
 
 class HDF5Writer:
     """Writer for HDF5 files."""
@@ -13,81 +342,108 @@ class HDF5Writer:
     def __init__(
         self,
         filepath: str,
-        compression: Optional[str] = "gzip",
-        compression_opts: int = 4,
+        compression: Optional[str] = "blosc",
+        compression_opts: Optional[int] = None,
         mode: str = "w",
+        cache_bytes: int = CHUNK_CACHE_BYTES,
+        direct_chunks: bool = False,
+        output_dtype=None,
+        swmr: bool = False,
+        drop_page_cache: bool = False,
     ):
         """
         Initialize HDF5 writer.
 
         Args:
             filepath: Path to the output HDF5 file
-            compression: Compression algorithm ('gzip', 'lzf', or None)
-            compression_opts: Compression level (0-9 for gzip)
+            compression: Compression algorithm ('blosc', 'blosclz4hc', 'zstd',
+                'blosc:<codec>', 'gzip', 'lzf', or None)
+            compression_opts: Compression level (0-9), None for the default level
+                of the chosen algorithm
             mode: File mode ('w' for write, 'a' for append)
+            cache_bytes: Size of the chunk cache of each open dataset in bytes
+            direct_chunks: Chunk time series one step at a time so that gzip
+                chunks compressed elsewhere with ``encode_time_slab`` can be
+                written as they are (ignored for other compressions)
+            output_dtype: Floating point dtype to store floating point arrays
+                with, e.g. ``np.float32`` to halve the data to compress and
+                write; None keeps the dtype of the input arrays
+            swmr: Switch to single-writer/multiple-reader mode once
+                ``init_time_series`` has created the datasets, so readers opened
+                with ``swmr=True`` see each time step as soon as it is
+                written; compressed time series then hold one time step per
+                chunk, as every step is flushed to disk on its own
+            drop_page_cache: On close, wait until the file is on disk and
+                drop its pages from the page cache (POSIX only), so a large
+                output does not push other data out of it; the wait costs
+                time, and reading the file right afterwards reads the disk
         """
         self.filepath = Path(filepath)
         self.compression = compression
         # Set compression_opts to None if compression is None
-        self.compression_opts = None if compression is None else compression_opts
+        if compression is None:
+            self.compression_opts = None
+        elif compression_opts is None:
+            self.compression_opts = default_compression_level(compression)
+        else:
+            self.compression_opts = compression_opts
+        self._compression_kwargs = compression_kwargs(
+            self.compression, self.compression_opts
+        )
         self.mode = mode
+        self.cache_bytes = cache_bytes
+        self.direct_chunks = direct_chunks and compression == "gzip"
+        if output_dtype is not None:
+            output_dtype = np.dtype(output_dtype)
+            if not np.issubdtype(output_dtype, np.floating):
+                raise ValueError(f"Output dtype must be floating point: {output_dtype}")
+        self.output_dtype = output_dtype
+        self.swmr = swmr
+        self.drop_page_cache = drop_page_cache
         self.file: Optional[h5py.File] = None
+        # Time series datasets stay open between steps, so their chunk cache
+        # (and any partially filled chunk in it) survives from one step to
+        # the next instead of being flushed whenever the handle is dropped
+        self._datasets: dict[str, h5py.Dataset] = {}
 
     def __enter__(self):
         """Context manager entry."""
-        self.file = h5py.File(self.filepath, self.mode)
+        self.file = self._open()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        if self.file:
-            self.file.close()
+        self.close()
 
-    def write(self, grid_data: dict[str, Any], time_step: Optional[int] = None) -> None:
+    def write(
+        self,
+        grid_data: dict[str, Any],
+        time_step: Optional[int] = None,
+        time_step_index: Optional[int] = None,
+    ) -> None:
         """
         Write grid data to HDF5 file.
 
         Args:
             grid_data: Dictionary containing grid data from VTSReader
-            time_step: Optional time step index for time series data
+            time_step: Optional time step index for time series data, written
+                to its own ``step_{time_step}`` group
+            time_step_index: Position of the grid in a time series created with
+                ``init_time_series``; takes precedence over ``time_step``
+
+        Raises:
+            ValueError if a time series step lacks arrays of the time series,
+                has others, or arrays of another shape
         """
         if self.file is None:
-            self.file = h5py.File(self.filepath, self.mode)
+            self.file = self._open()
 
-        try:
-            # Write origin and spacing at root level (only once)
-            if "origin" not in self.file and "bounds" in grid_data:
-                bounds = grid_data["bounds"]
-                dims = grid_data["dimensions"]
-
-                # Calculate origin from bounds
-                origin = np.array([bounds[0], bounds[2], bounds[4]], dtype=np.float64)
-                self.file.create_dataset(
-                    "origin",
-                    data=origin,
-                    compression=self.compression,
-                    compression_opts=self.compression_opts,
-                )
+        if time_step_index is not None:
+            self._write_time_slab(grid_data, time_step_index)
+            return
 
-                # Calculate spacing from bounds and dimensions
-                spacing = np.array(
-                    [
-                        (bounds[1] - bounds[0]) / max(1, dims[0] - 1),
-                        (bounds[3] - bounds[2]) / max(1, dims[1] - 1),
-                        (
-                            (bounds[5] - bounds[4]) / max(1, dims[2] - 1)
-                            if dims[2] > 1
-                            else 0.0
-                        ),
-                    ],
-                    dtype=np.float64,
-                )
-                self.file.create_dataset(
-                    "spacing",
-                    data=spacing,
-                    compression=self.compression,
-                    compression_opts=self.compression_opts,
-                )
+        try:
+            self._write_geometry(grid_data)
 
             # Determine group prefix for time series
             prefix = f"step_{time_step}/" if time_step is not None else ""
@@ -95,51 +451,380 @@ class HDF5Writer:
             # Write point data
             if grid_data["point_data"]:
                 point_data_group = self.file.require_group(f"{prefix}point_data")
+                # One listing of the group instead of an HDF5 lookup per array
+                existing = set(point_data_group)
+                # Reshape to 3D array in Z,Y,X order for XDMF compatibility,
+                # keeping the component axis of vector and tensor arrays
+                shape = point_shape(grid_data["dimensions"])
                 for name, array in grid_data["point_data"].items():
-                    if name not in point_data_group:
-                        # Reshape to 3D array in Z,Y,X order for XDMF compatibility
-                        dims = grid_data["dimensions"]
-                        nx, ny, nz = dims[0], dims[1], dims[2]
-                        reshaped = array.reshape((nz, ny, nx))
-                        point_data_group.create_dataset(
-                            name,
-                            data=reshaped,
-                            compression=self.compression,
-                            compression_opts=self.compression_opts,
-                        )
+                    if name not in existing:
+                        array_shape = (*shape, *np.shape(array)[1:])
+                        self._create_dataset(point_data_group, name, array, array_shape)
+                        existing.add(name)
 
             # Write cell data
             if grid_data["cell_data"]:
                 cell_data_group = self.file.require_group(f"{prefix}cell_data")
+                existing = set(cell_data_group)
                 for name, array in grid_data["cell_data"].items():
-                    if name not in cell_data_group:
-                        cell_data_group.create_dataset(
-                            name,
-                            data=array,
-                            compression=self.compression,
-                            compression_opts=self.compression_opts,
-                        )
+                    if name not in existing:
+                        self._create_dataset(cell_data_group, name, array)
+                        existing.add(name)
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to write HDF5 file: {e}") from e
+
+    @property
+    def precompress_level(self) -> Optional[int]:
+        """Deflate level for ``encode_time_slab``, None without direct chunks."""
+        return self.compression_opts if self.direct_chunks else None
+
+    def init_time_series(
+        self, grid_data: dict[str, Any], time_steps: list[int]
+    ) -> None:
+        """
+        Create fixed-size time series datasets for all arrays of a grid.
+
+        Each array becomes one dataset with the time step as its first axis,
+        ``point_data/<name>`` of shape (T, nz, ny, nx) and ``cell_data/<name>``
+        of shape (T, nz-1, ny-1, nx-1). The full shape is allocated once, so
+        writing a time step with ``write(..., time_step_index=i)`` never
+        resizes a dataset. The step numbers are stored in ``time_steps``.
+
+        Args:
+            grid_data: Grid data of the first time step, used as a template
+                for dimensions, array names and dtypes
+            time_steps: Step number of every time step, in write order
+        """
+        if self.file is None:
+            self.file = self._open()
+
+        try:
+            self._write_geometry(grid_data)
+            self.file.create_dataset(
+                "time_steps", data=np.asarray(time_steps, dtype=np.int64)
+            )
+
+            num_steps = len(time_steps)
+            sections = [
+                ("point_data", point_shape(grid_data["dimensions"])),
+                ("cell_data", cell_shape(grid_data["dimensions"])),
+            ]
+            for section, spatial in sections:
+                if not grid_data[section]:
+                    continue
+                group = self.file.require_group(section)
+                for name, array in grid_data[section].items():
+                    array = np.asarray(array)
+                    shape = (num_steps, *spatial, *array.shape[1:])
+                    dtype = stored_dtype(array.dtype, self.output_dtype)
+                    if self.direct_chunks or (self.swmr and self._compression_kwargs):
+                        # One time step per chunk, as laid out by encode_chunks;
+                        # with SWMR each step's flush then compresses only its
+                        # own chunks instead of a partly filled shared one again
+                        step_chunks = chunk_shape(shape[1:], dtype.itemsize)
+                        chunks = (1, *step_chunks)
+                    else:
+                        chunks = self._chunks_for(shape, dtype)
+                    self._datasets[f"{section}/{name}"] = group.create_dataset(
+                        name,
+                        shape=shape,
+                        dtype=dtype,
+                        chunks=chunks,
+                        **self._compression_kwargs,
+                    )
+            if self.swmr:
+                # No objects can be created from here on, only data written
+                self.file.swmr_mode = True
+        except Exception as e:
+            raise RuntimeError(f"Failed to write HDF5 file: {e}") from e
+
+    def _check_time_slab(self, grid_data: dict[str, Any]) -> None:
+        """
+        Check that a time step has exactly the arrays of the time series.
+
+        A step lacking an array would leave its slab at the fill value and
+        read back as zeros, so it is rejected like an unknown array.
 
+        Args:
+            grid_data: Grid data of the time step
+
+        Raises:
+            ValueError if arrays are missing, unknown or of another shape
+        """
+        if not self._datasets:
+            # File opened without init_time_series, e.g. in append mode
+            for section in ("point_data", "cell_data"):
+                if section in self.file:
+                    for name, dataset in self.file[section].items():
+                        self._datasets[f"{section}/{name}"] = dataset
+
+        paths = {
+            f"{section}/{name}"
+            for section in ("point_data", "cell_data")
+            for name in grid_data[section]
+        }
+        missing = sorted(self._datasets.keys() - paths)
+        if missing:
+            raise ValueError(f"Arrays missing from time step: {', '.join(missing)}")
+        unknown = sorted(paths - self._datasets.keys())
+        if unknown:
+            raise ValueError(f"Arrays not in the time series: {', '.join(unknown)}")
+
+        for section in ("point_data", "cell_data"):
+            for name, array in grid_data[section].items():
+                path = f"{section}/{name}"
+                step_shape = self._datasets[path].shape[1:]
+                shape = np.shape(array)
+                # (num_values, *components) against (nz, ny, nx, *components)
+                if np.size(array) != prod(step_shape) or shape[1:] != step_shape[3:]:
+                    raise ValueError(
+                        f"Array {path} has shape {shape}, "
+                        f"the time series stores {step_shape}"
+                    )
+
+    def _write_time_slab(self, grid_data: dict[str, Any], index: int) -> None:
+        """Write one time step into the datasets created by init_time_series."""
+        self._check_time_slab(grid_data)
+        encoded = grid_data.get("encoded_chunks") if self.direct_chunks else None
+        try:
+            for section in ("point_data", "cell_data"):
+                for name, array in grid_data[section].items():
+                    path = f"{section}/{name}"
+                    dataset = self._datasets[path]
+                    if encoded and path in encoded:
+                        # Already compressed by a worker, skip the filter pipeline
+                        for offset, data in encoded[path]:
+                            dataset.id.write_direct_chunk((index, *offset), data)
+                    else:
+                        step = output_array(array, self.output_dtype)
+                        step = np.ascontiguousarray(step).reshape(dataset.shape[1:])
+                        dataset.write_direct(step, dest_sel=np.s_[index])
+                    if self.swmr:
+                        # Make the step visible to concurrent SWMR readers
+                        dataset.flush()
         except Exception as e:
             raise RuntimeError(f"Failed to write HDF5 file: {e}") from e
 
+    def _create_dataset(
+        self,
+        group: h5py.Group,
+        name: str,
+        array,
+        shape: Optional[tuple[int, ...]] = None,
+    ) -> None:
+        """
+        Create a dataset for an array and write it without intermediate copies.
+
+        The array is made C-contiguous once, so the reshape below is a view and
+        ``write_direct`` hands the buffer to HDF5 as is, instead of h5py
+        converting a strided view element by element.
+
+        Args:
+            group: Group to create the dataset in
+            name: Dataset name
+            array: Array data
+            shape: Shape to store the array as, defaults to its own shape
+        """
+        data = np.ascontiguousarray(output_array(array, self.output_dtype))
+        if shape is not None:
+            data = data.reshape(shape)
+        dataset = group.create_dataset(
+            name,
+            shape=data.shape,
+            dtype=data.dtype,
+            chunks=self._chunks(data),
+            **self._compression_kwargs,
+        )
+        dataset.write_direct(data)
+
+    def _write_geometry(self, grid_data: dict[str, Any]) -> None:
+        """Write origin and spacing at root level (only once)."""
+        if "origin" not in self.file and "bounds" in grid_data:
+            origin, spacing = grid_geometry(grid_data)
+            # Three values each; stored contiguous, a compression filter
+            # would only add overhead
+            self.file.create_dataset("origin", data=origin)
+            self.file.create_dataset("spacing", data=spacing)
+
+    def _open(self) -> h5py.File:
+        """Open the output file with a chunk cache sized for write-once chunks."""
+        return h5py.File(
+            self.filepath,
+            self.mode,
+            # HDF5 1.10 format: faster metadata, still readable by ParaView/VisIt
+            libver="v110",
+            rdcc_nbytes=self.cache_bytes,
+            rdcc_nslots=CHUNK_CACHE_SLOTS,
+            # Fully written chunks are never read back, evict them first
+            rdcc_w0=1.0,
+        )
+
+    def _chunks(self, array: np.ndarray) -> Optional[tuple[int, ...]]:
+        """Chunk shape for an array, None to keep uncompressed data contiguous."""
+        return self._chunks_for(array.shape, array.dtype)
+
+    def _chunks_for(
+        self, shape: tuple[int, ...], dtype: np.dtype
+    ) -> Optional[tuple[int, ...]]:
+        """Chunk shape for a dataset, None to keep uncompressed data contiguous."""
+        if not self._compression_kwargs:
+            return None
+        # A chunk that fits in the cache stays there while its time steps are
+        # written one by one, and is compressed once when it is complete
+        max_bytes = min(MAX_CHUNK_BYTES, self.cache_bytes)
+        return chunk_shape(shape, np.dtype(dtype).itemsize, max_bytes)
+
     def close(self) -> None:
         """Close the HDF5 file."""
+        self._datasets.clear()
         if self.file:
-            self.file.close()
-            self.file = None
+            fd = None
+            if self.drop_page_cache and hasattr(os, "posix_fadvise"):
+                # Duplicated so the pages can be dropped after the final flush
+                fd = os.dup(self.file.id.get_vfd_handle())
+            try:
+                self.file.close()
+            finally:
+                self.file = None
+                if fd is not None:
+                    try:
+                        # Dirty pages cannot be dropped, only clean ones
+                        os.fdatasync(fd)
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    except OSError:
+                        pass
+                    finally:
+                        os.close(fd)
 
     def write_multiple(self, grid_data_list: list, start_index: int = 0) -> None:
         """
         Write multiple time steps to HDF5 file.
 
+        Grids of equal dimensions and arrays (names and shapes) are written
+        with ``write_time_series``, one (T, nz, ny, nx) dataset per array with
+        steps ``start_index`` onwards. Other grids get one ``step_<n>`` group
+        per grid instead, and so do all grids written to a file that already
+        has step groups, so that a file never mixes both layouts.
+
+        The time series datasets have a fixed number of steps, so all grids
+        of a time series must be written in a single call.
+
         Args:
             grid_data_list: List of grid data dictionaries
             start_index: Starting time step index
+
+        Raises:
+            ValueError if the file already holds a time series
         """
+        if not grid_data_list:
+            return
+        if self.file is None:
+            self.file = self._open()
+
+        if "time_steps" in self.file:
+            raise ValueError(
+                "File already holds a time series of fixed length; "
+                "write all time steps in a single write_multiple call"
+            )
+
+        first = _array_layout(grid_data_list[0])
+        same_grid = all(_array_layout(g) == first for g in grid_data_list[1:])
+        has_step_groups = any(name.startswith("step_") for name in self.file)
+        if same_grid and not has_step_groups:
+            time_steps = list(range(start_index, start_index + len(grid_data_list)))
+            self.write_time_series(grid_data_list, time_steps)
+            return
+
         for i, grid_data in enumerate(grid_data_list):
             self.write(grid_data, time_step=start_index + i)
 
+    def write_multiple_parallel(
+        self, vts_paths: list, start_index: int = 0, workers: Optional[int] = None
+    ) -> list[Path]:
+        """
+        Convert multiple VTS files in parallel, one HDF5 file per time step.
+
+        Each worker process reads one VTS file and writes it, compressed, to
+        ``<stem>_step_<n>.h5`` next to the output file. The output file then
+        gets a ``step_<n>`` external link to the root of every such file, so
+        it has the layout of ``write(grid_data, time_step=n)`` step groups
+        (not the time series datasets of ``write_multiple``). The step files
+        must be kept, and moved together with the output file.
+
+        Args:
+            vts_paths: Paths of the VTS files, in time step order
+            start_index: Starting time step index
+            workers: Number of worker processes, defaults to the CPU count
+
+        Returns:
+            Paths of the per-step HDF5 files
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import get_context
+
+        if self.file is None:
+            self.file = self._open()
+
+        steps = range(start_index, start_index + len(vts_paths))
+        shard_paths = [
+            self.filepath.with_name(f"{self.filepath.stem}_step_{step}.h5")
+            for step in steps
+        ]
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=get_context("spawn")
+            ) as executor:
+                geometries = list(
+                    executor.map(
+                        write_step_shard,
+                        [str(path) for path in vts_paths],
+                        [str(path) for path in shard_paths],
+                        [self.compression] * len(vts_paths),
+                        [self.compression_opts] * len(vts_paths),
+                        [self.output_dtype] * len(vts_paths),
+                    )
+                )
+
+            if geometries:
+                self._write_geometry(geometries[0])
+            # Relative links, resolved against the directory of this file
+            for step, shard_path in zip(steps, shard_paths):
+                self.file[f"step_{step}"] = h5py.ExternalLink(shard_path.name, "/")
+        except Exception as e:
+            raise RuntimeError(f"Failed to write HDF5 file: {e}") from e
+
+        return shard_paths
+
+    def write_time_series(
+        self, grid_data_list: list, time_steps: Optional[list[int]] = None
+    ) -> None:
+        """
+        Write multiple time steps as time series datasets.
+
+        Every array becomes a single (T, nz, ny, nx) dataset created by
+        ``init_time_series``; use ``XDMFGenerator.generate_temporal_collection``
+        with ``time_series=True`` to describe the result.
+
+        Args:
+            grid_data_list: List of grid data dictionaries, all with the
+                dimensions and arrays of the first
+            time_steps: Step number of every grid, defaults to 0..T-1
+        """
+        if not grid_data_list:
+            return
+        if time_steps is None:
+            time_steps = list(range(len(grid_data_list)))
+        if len(time_steps) != len(grid_data_list):
+            raise ValueError(
+                f"Got {len(time_steps)} time steps for {len(grid_data_list)} grids"
+            )
+
+        self.init_time_series(grid_data_list[0], time_steps)
+        for i, grid_data in enumerate(grid_data_list):
+            self.write(grid_data, time_step_index=i)
+
     def get_file_size(self) -> int:
         """
         Get the size of the HDF5 file in bytes.
@@ -9,6 +9,36 @@ import vtk
 from vtk.util import numpy_support
 
 
+def make_grid_points(nx, ny, nz, spacing=1.0):
+    """Create the points of a uniform grid in VTK order (x varies fastest)."""
+    k, j, i = np.meshgrid(np.arange(nz), np.arange(ny), np.arange(nx), indexing="ij")
+    coords = np.stack([i, j, k], axis=-1).reshape(-1, 3).astype(np.float64) * spacing
+
+    points = vtk.vtkPoints()
+    points.SetData(numpy_support.numpy_to_vtk(coords, deep=True))
+    return points
+
+
+def write_vts_file(output_file, dimensions, point_data):
+    """Write a uniform structured grid with the given point arrays to a VTS file."""
+    nx, ny, nz = dimensions
+
+    grid = vtk.vtkStructuredGrid()
+    grid.SetDimensions(nx, ny, nz)
+    grid.SetPoints(make_grid_points(nx, ny, nz))
+
+    for name, values in point_data.items():
+        array = numpy_support.numpy_to_vtk(values, deep=True)
+        array.SetName(name)
+        grid.GetPointData().AddArray(array)
+
+    writer = vtk.vtkXMLStructuredGridWriter()
+    writer.SetFileName(str(output_file))
+    writer.SetInputData(grid)
+    writer.Write()
+    return output_file
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
@@ -23,14 +53,7 @@ def sample_vts_file(temp_dir):
     nx, ny, nz = 10, 10, 10
 
     # Create points
-    points = vtk.vtkPoints()
-    for k in range(nz):
-        for j in range(ny):
-            for i in range(nx):
-                x = float(i) * 0.1
-                y = float(j) * 0.1
-                z = float(k) * 0.1
-                points.InsertNextPoint(x, y, z)
+    points = make_grid_points(nx, ny, nz, spacing=0.1)
 
     # Create structured grid
     grid = vtk.vtkStructuredGrid()
@@ -64,17 +87,10 @@ def sample_vts_files(temp_dir):
     files = []
     nx, ny, nz = 10, 10, 10
 
-    for step in [0, 100, 200]:
-        # Create points
-        points = vtk.vtkPoints()
-        for k in range(nz):
-            for j in range(ny):
-                for i in range(nx):
-                    x = float(i) * 0.1
-                    y = float(j) * 0.1
-                    z = float(k) * 0.1
-                    points.InsertNextPoint(x, y, z)
+    # Create points, shared by all time steps
+    points = make_grid_points(nx, ny, nz, spacing=0.1)
 
+    for step in [0, 100, 200]:
         # Create structured grid
         grid = vtk.vtkStructuredGrid()
         grid.SetDimensions(nx, ny, nz)
@@ -98,6 +114,64 @@ def sample_vts_files(temp_dir):
     return files
 
 
+@pytest.fixture
+def mismatched_vts_files(sample_vts_files, temp_dir):
+    """Create a time series whose last file has different grid dimensions."""
+    nx, ny, nz = 5, 5, 5
+
+    points = make_grid_points(nx, ny, nz)
+
+    grid = vtk.vtkStructuredGrid()
+    grid.SetDimensions(nx, ny, nz)
+    grid.SetPoints(points)
+
+    temperature = np.random.rand(nx * ny * nz).astype(np.float64)
+    temp_array = numpy_support.numpy_to_vtk(temperature)
+    temp_array.SetName("temperature")
+    grid.GetPointData().AddArray(temp_array)
+
+    output_file = temp_dir / "scalar_variables_step300.vts"
+    writer = vtk.vtkXMLStructuredGridWriter()
+    writer.SetFileName(str(output_file))
+    writer.SetInputData(grid)
+    writer.Write()
+
+    return [*sample_vts_files, output_file]
+
+
+@pytest.fixture
+def missing_array_vts_files(temp_dir):
+    """Create a time series whose second file lacks the pressure array."""
+    num_points = 4 * 3 * 2
+    full = {
+        "temperature": np.full(num_points, 7.0),
+        "pressure": np.full(num_points, 1.0),
+    }
+    partial = {"temperature": full["temperature"]}
+
+    return [
+        write_vts_file(temp_dir / "scalar_variables_step0.vts", (4, 3, 2), full),
+        write_vts_file(temp_dir / "scalar_variables_step1.vts", (4, 3, 2), partial),
+        write_vts_file(temp_dir / "scalar_variables_step2.vts", (4, 3, 2), full),
+    ]
+
+
+@pytest.fixture
+def vector_vts_files(temp_dir):
+    """Create a time series with a scalar and a 3-component vector array."""
+    num_points = 4 * 3 * 2
+    files = []
+    for step in [0, 1]:
+        point_data = {
+            "temperature": np.arange(num_points, dtype=np.float64) + step,
+            "velocity": np.arange(num_points * 3, dtype=np.float64).reshape(-1, 3)
+            * (step + 1),
+        }
+        output_file = temp_dir / f"vector_variables_step{step}.vts"
+        files.append(write_vts_file(output_file, (4, 3, 2), point_data))
+    return files
+
+
 @pytest.fixture
 def invalid_vts_file(temp_dir):
     """Create an invalid VTS file for error testing."""
@@ -114,9 +188,8 @@ def corrupted_vts_file(temp_dir):
     return corrupted_file
 
 
-@pytest.fixture
-def sample_grid_data():
-    """Create sample grid data dictionary for testing."""
+def make_grid_data():
+    """Create a grid data dictionary like VTSReader.read returns."""
     nx, ny, nz = 10, 10, 10
     num_points = nx * ny * nz
 
@@ -137,3 +210,38 @@ def sample_grid_data():
             "num_cell_arrays": 0,
         },
     }
+
+
+@pytest.fixture
+def sample_grid_data():
+    """Create sample grid data dictionary for testing."""
+    return make_grid_data()
+
+
+@pytest.fixture(scope="module")
+def shared_grid_data():
+    """Grid data shared by the tests of a module; must not be modified."""
+    return make_grid_data()
+
+
+@pytest.fixture(scope="module")
+def pre_written_h5(tmp_path_factory, shared_grid_data):
+    """HDF5 file of shared_grid_data, written once for read-only tests."""
+    from vts2h5.writer import HDF5Writer
+
+    h5_file = tmp_path_factory.mktemp("hdf5") / "shared.h5"
+    with HDF5Writer(str(h5_file)) as writer:
+        writer.write(shared_grid_data)
+    return h5_file
+
+
+@pytest.fixture(scope="module")
+def xdmf_tree(pre_written_h5, shared_grid_data):
+    """Parsed XDMF file of pre_written_h5, generated once for read-only tests."""
+    from lxml import etree
+
+    from vts2h5.xdmf import XDMFGenerator
+
+    xdmf_file = pre_written_h5.with_suffix(".xdmf2")
+    XDMFGenerator(str(pre_written_h5), shared_grid_data).generate(str(xdmf_file))
+    return etree.parse(str(xdmf_file))
@@ -1,6 +1,8 @@
 """Tests for CLI module."""
 
+import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
@@ -9,6 +11,7 @@ from vts2h5.cli import (
     display_folder_info,
     find_vts_files,
     parse_args,
+    scan_vts_files,
 )
 
 
@@ -88,6 +91,14 @@ class TestParseArgs:
 
         assert args.jobs == 4
 
+    def test_dtype_flag(self, monkeypatch):
+        """Test --dtype flag and its default."""
+        monkeypatch.setattr(sys, "argv", ["vts2h5", "data/test1"])
+        assert parse_args().dtype == "auto"
+
+        monkeypatch.setattr(sys, "argv", ["vts2h5", "data/test1", "--dtype", "float32"])
+        assert parse_args().dtype == "float32"
+
     def test_info_flag(self, monkeypatch):
         """Test --info flag."""
         monkeypatch.setattr(sys, "argv", ["vts2h5", "data/test1", "--info"])
@@ -100,8 +111,8 @@ class TestParseArgs:
         monkeypatch.setattr(sys, "argv", ["vts2h5", "data/test1"])
         args = parse_args()
 
-        assert args.compression == "gzip"
-        assert args.compression_level == 4
+        assert args.compression == "blosc"
+        assert args.compression_level is None
 
     def test_default_jobs(self, monkeypatch):
         """Test default jobs setting."""
@@ -180,6 +191,54 @@ class TestFindVTSFiles:
         assert len(files) == 2
         assert all(f.suffix == ".vts" for f in files)
 
+    def test_skips_folders(self, temp_dir):
+        """Test that folders named like VTS files are ignored."""
+        (temp_dir / "step0.vts").touch()
+        (temp_dir / "step100.vts").mkdir()
+
+        files = find_vts_files(temp_dir)
+
+        assert files == [temp_dir / "step0.vts"]
+
+    def test_does_not_stat_files(self, temp_dir, monkeypatch):
+        """Test that finding files reads only the directory listing."""
+        (temp_dir / "step0.vts").touch()
+        (temp_dir / "step100.vts").touch()
+        scandir = os.scandir
+
+        class NoStatEntry:
+            def __init__(self, entry):
+                self.name, self.path = entry.name, entry.path
+                self.is_file = entry.is_file
+
+            def stat(self):
+                raise AssertionError(f"stat() called on {self.path}")
+
+        @contextmanager
+        def no_stat_scandir(path):
+            with scandir(path) as entries:
+                yield [NoStatEntry(entry) for entry in entries]
+
+        monkeypatch.setattr(os, "scandir", no_stat_scandir)
+
+        files = find_vts_files(temp_dir)
+
+        assert files == [temp_dir / "step0.vts", temp_dir / "step100.vts"]
+
+
+class TestScanVTSFiles:
+    """Test cases for scan_vts_files function."""
+
+    def test_sizes_match_stat(self, sample_vts_files):
+        """Test that scanned sizes match the files on disk."""
+        folder = sample_vts_files[0].parent
+
+        scanned = scan_vts_files(folder)
+
+        assert [path for path, _ in scanned] == find_vts_files(folder)
+        for path, size in scanned:
+            assert size == path.stat().st_size
+
 
 class TestDisplayFolderInfo:
     """Test cases for display_folder_info function."""
@@ -294,3 +353,18 @@ class TestCLIIntegration:
         captured = capsys.readouterr()
         # Should have minimal output in silent mode
         assert len(captured.out) == 0 or captured.out.strip() == ""
+
+    def test_import_does_not_load_vtk(self):
+        """Test that importing the CLI leaves the numerical libraries unloaded."""
+        import subprocess
+
+        code = (
+            "import sys, vts2h5.cli; "
+            "heavy = ('vtk', 'h5py', 'hdf5plugin', 'numpy', 'lxml', 'tqdm'); "
+            "print(sorted(m for m in heavy if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
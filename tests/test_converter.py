@@ -1,16 +1,33 @@
 """Tests for converter module."""
 
+import os
 import re
+import sys
 from pathlib import Path
 
 import h5py
+import numpy as np
 import pytest
 
 from vts2h5.converter import (
+    USE_SHARED_MEMORY,
+    advise_file,
+    attach_shared_arrays,
     convert_vts_to_hdf5,
+    create_pool,
+    default_jobs,
+    export_shared_arrays,
     extract_time_steps,
+    iter_grids_parallel,
+    iter_grids_sequential,
+    parse_step_number,
+    peek_dimensions,
     read_vts_file_worker,
+    read_vts_info_worker,
+    release_shared_arrays,
+    summarize_grid,
 )
+from vts2h5.reader import VTSReader
 
 
 class TestExtractTimeSteps:
@@ -79,6 +96,26 @@ class TestExtractTimeSteps:
         assert time_steps == [0, 1, 100]
 
 
+class TestParseStepNumber:
+    """Test cases for parse_step_number function."""
+
+    @pytest.mark.parametrize(
+        "stem,expected",
+        [
+            ("scalar_variables_step100", 100),
+            ("step_10", 10),
+            ("step 7", 7),
+            ("data1", None),
+            ("steps_only", None),
+            ("step5_final", 5),
+            ("stepx_step3", 3),
+        ],
+    )
+    def test_parse(self, stem, expected):
+        """Test step extraction from various file name stems."""
+        assert parse_step_number(stem) == expected
+
+
 class TestReadVTSFileWorker:
     """Test cases for read_vts_file_worker function."""
 
@@ -108,6 +145,229 @@ class TestReadVTSFileWorker:
         actual_size = sample_vts_file.stat().st_size
         assert file_size == actual_size
 
+    def test_without_geometry(self, sample_vts_file):
+        """Test that geometry=False leaves out the point coordinates only."""
+        grid_data, _ = read_vts_file_worker(str(sample_vts_file), geometry=False)
+
+        assert "points" not in grid_data
+        assert "bounds" in grid_data
+        assert "temperature" in grid_data["point_data"]
+
+
+@pytest.mark.skipif(not USE_SHARED_MEMORY, reason="POSIX shared memory only")
+class TestSharedArrays:
+    """Test cases for shared memory transfer of grid arrays."""
+
+    def test_round_trip(self, sample_grid_data):
+        """Test that arrays survive export and attach unchanged."""
+        shared = export_shared_arrays(sample_grid_data)
+        grid_data, blocks = attach_shared_arrays(shared)
+
+        assert grid_data["dimensions"] == sample_grid_data["dimensions"]
+        np.testing.assert_array_equal(grid_data["points"], sample_grid_data["points"])
+        for name, array in sample_grid_data["point_data"].items():
+            np.testing.assert_array_equal(grid_data["point_data"][name], array)
+
+        release_shared_arrays(grid_data, blocks)
+        assert grid_data["point_data"] == {}
+
+    def test_export_leaves_input_untouched(self, sample_grid_data):
+        """Test that exporting does not modify the source grid."""
+        shared = export_shared_arrays(sample_grid_data)
+
+        assert isinstance(sample_grid_data["points"], np.ndarray)
+        release_shared_arrays(*attach_shared_arrays(shared))
+
+    def test_round_trip_without_points(self, sample_grid_data):
+        """Test that grids read without geometry can be shared."""
+        grid_data = {k: v for k, v in sample_grid_data.items() if k != "points"}
+
+        attached, blocks = attach_shared_arrays(export_shared_arrays(grid_data))
+
+        assert "points" not in attached
+        assert len(blocks) == len(grid_data["point_data"]) + len(
+            grid_data["cell_data"]
+        )
+        release_shared_arrays(attached, blocks)
+
+
+class TestReadVTSInfoWorker:
+    """Test cases for read_vts_info_worker function."""
+
+    def test_matches_get_info(self, sample_vts_files):
+        """Test that the header summary matches a full VTK read."""
+        filepath = str(sample_vts_files[0])
+        info = VTSReader(filepath).get_info()
+
+        summary = read_vts_info_worker(filepath)
+
+        for key in ["dimensions", "num_points", "num_cells"]:
+            assert summary[key] == info[key]
+        assert summary["point_arrays"] == info["point_arrays"]
+        assert summary["cell_arrays"] == info["cell_arrays"]
+        assert summary["file_size"] == sample_vts_files[0].stat().st_size
+
+    def test_invalid_file(self, invalid_vts_file):
+        """Test that an unparsable header raises ValueError."""
+        with pytest.raises(ValueError, match="Failed to read"):
+            read_vts_info_worker(str(invalid_vts_file))
+
+    def test_not_a_structured_grid(self, corrupted_vts_file):
+        """Test that XML without a StructuredGrid raises ValueError."""
+        with pytest.raises(ValueError, match="no StructuredGrid"):
+            read_vts_info_worker(str(corrupted_vts_file))
+
+
+class TestAdviseFile:
+    """Test cases for advise_file function."""
+
+    def test_advise_existing_file(self, sample_vts_files):
+        """Test that hints on an existing file do not raise."""
+        advise_file(str(sample_vts_files[0]), "POSIX_FADV_WILLNEED")
+        advise_file(str(sample_vts_files[0]), "POSIX_FADV_DONTNEED")
+
+    def test_missing_file_ignored(self, temp_dir):
+        """Test that a missing file is silently ignored."""
+        advise_file(str(temp_dir / "missing.vts"), "POSIX_FADV_WILLNEED")
+
+    def test_unknown_advice_ignored(self, sample_vts_files):
+        """Test that advice unsupported on this platform is a no-op."""
+        advise_file(str(sample_vts_files[0]), "POSIX_FADV_UNKNOWN")
+
+
+class TestPeekDimensions:
+    """Test cases for peek_dimensions function."""
+
+    def test_matches_full_read(self, sample_vts_files):
+        """Test that header dimensions match the decoded grid."""
+        filepath = str(sample_vts_files[0])
+
+        assert peek_dimensions(filepath) == VTSReader(filepath).read()["dimensions"]
+
+    def test_invalid_file(self, invalid_vts_file):
+        """Test that an unparsable file yields None."""
+        assert peek_dimensions(str(invalid_vts_file)) is None
+
+    def test_missing_file(self, temp_dir):
+        """Test that a missing file yields None."""
+        assert peek_dimensions(str(temp_dir / "missing.vts")) is None
+
+
+class TestSummarizeGrid:
+    """Test cases for summarize_grid function."""
+
+    def test_matches_get_info(self, sample_vts_files):
+        """Test that the summary matches a fresh VTSReader.get_info."""
+        filepath = str(sample_vts_files[0])
+        reader = VTSReader(filepath)
+
+        summary = summarize_grid(reader.read(), filepath)
+        info = reader.get_info()
+
+        assert summary["bounds"] == pytest.approx(info.pop("bounds"))
+        summary.pop("bounds")
+        assert summary == info
+
+
+class TestDefaultJobs:
+    """Test cases for default_jobs function."""
+
+    def test_within_available_cpus(self):
+        """Test that the default worker count is positive and not oversubscribed."""
+        assert 1 <= default_jobs() <= os.cpu_count()
+
+    def test_without_psutil(self, monkeypatch):
+        """Test falling back to the logical CPU count without psutil."""
+        monkeypatch.setitem(sys.modules, "psutil", None)
+
+        assert 1 <= default_jobs() <= os.cpu_count()
+
+
+class TestIterGridsSequential:
+    """Test cases for iter_grids_sequential function."""
+
+    def test_yields_in_input_order(self, sample_vts_files):
+        """Test that grids read ahead in the background come back in order."""
+        file_paths = [str(f) for f in sample_vts_files]
+
+        results = list(iter_grids_sequential(file_paths, prefetch=1))
+
+        assert [index for index, _, _ in results] == [0, 1, 2]
+        for (_, grid_data, _), path in zip(results, sample_vts_files):
+            assert grid_data["metadata"]["source_file"] == str(path)
+        assert ["points" in grid_data for _, grid_data, _ in results] == [
+            True,
+            False,
+            False,
+        ]
+
+    def test_read_error_raised_in_consumer(self, temp_dir, sample_vts_files):
+        """Test that a failed read is raised after the preceding grids."""
+        file_paths = [str(sample_vts_files[0]), str(temp_dir / "missing.vts")]
+
+        grids = iter_grids_sequential(file_paths)
+
+        assert next(grids)[0] == 0
+        with pytest.raises(Exception, match="missing.vts"):
+            next(grids)
+
+    def test_precompress_in_background(self, temp_dir, sample_vts_files):
+        """Test that grids come with gzip chunks and errors keep their order."""
+        file_paths = [str(sample_vts_files[0]), str(sample_vts_files[1])]
+        file_paths.append(str(temp_dir / "missing.vts"))
+
+        grids = iter_grids_sequential(file_paths, precompress_level=4)
+
+        for index in range(2):
+            item_index, grid_data, _ = next(grids)
+            assert item_index == index
+            assert set(grid_data["encoded_chunks"]) == {
+                f"point_data/{name}" for name in grid_data["point_data"]
+            } | {f"cell_data/{name}" for name in grid_data["cell_data"]}
+        with pytest.raises(Exception, match="missing.vts"):
+            next(grids)
+
+    def test_early_close_stops_reader(self, sample_vts_files):
+        """Test that closing the iterator early does not hang."""
+        file_paths = [str(f) for f in sample_vts_files]
+
+        grids = iter_grids_sequential(file_paths, prefetch=1)
+        next(grids)
+        grids.close()
+
+
+class TestCreatePool:
+    """Test cases for create_pool function."""
+
+    def test_spawned_workers_preload_vtk(self):
+        """Test that workers are spawned and have VTK imported on start."""
+        with create_pool(1) as pool:
+            imported = pool.apply(_imported_modules, (["vtk", "vts2h5.reader"],))
+
+        assert pool._ctx.get_start_method() == "spawn"
+        assert imported == [True, True]
+
+
+def _imported_modules(names):
+    """Report which modules a worker has imported (runs in the worker)."""
+    return [name in sys.modules for name in names]
+
+
+class TestIterGridsParallel:
+    """Test cases for iter_grids_parallel function."""
+
+    def test_yields_in_input_order(self, sample_vts_files):
+        """Test that grids come back in input order with a small window."""
+        file_paths = [str(f) for f in sample_vts_files]
+
+        with create_pool(2) as pool:
+            results = list(iter_grids_parallel(pool, file_paths, window=1))
+
+        assert [index for index, _, _ in results] == [0, 1, 2]
+        for (_, grid_data, file_size), path in zip(results, sample_vts_files):
+            assert grid_data["metadata"]["source_file"] == str(path)
+            assert file_size == path.stat().st_size
+
 
 class TestConvertVTSToHDF5:
     """Test cases for convert_vts_to_hdf5 function."""
@@ -163,12 +423,29 @@ class TestConvertVTSToHDF5:
             assert "spacing" in f
 
             # Check for time steps
-            assert "step_0" in f
-            assert "step_100" in f
-            assert "step_200" in f
+            np.testing.assert_array_equal(f["time_steps"][...], [0, 100, 200])
+
+            # Check for point data, one (T, nz, ny, nx) dataset per array
+            assert f["point_data/temperature"].shape == (3, 10, 10, 10)
+            assert f["point_data/temperature"].maxshape == (3, 10, 10, 10)
+
+    def test_time_series_matches_input(self, temp_dir, sample_vts_files):
+        """Test that each time slab holds the data of its VTS file."""
+        output_h5 = temp_dir / "output.h5"
+
+        convert_vts_to_hdf5(
+            input_files=sample_vts_files,
+            output_file=output_h5,
+            xdmf_output=temp_dir / "output.xdmf2",
+            silent=True,
+        )
 
-            # Check for point data
-            assert "temperature" in f["step_0/point_data"]
+        with h5py.File(output_h5, "r") as f:
+            for i, path in enumerate(sample_vts_files):
+                expected = VTSReader(str(path)).read()["point_data"]["temperature"]
+                np.testing.assert_array_equal(
+                    f["point_data/temperature"][i], expected.reshape(10, 10, 10)
+                )
 
     def test_compression_gzip(self, temp_dir, sample_vts_files):
         """Test conversion with gzip compression."""
@@ -185,7 +462,7 @@ class TestConvertVTSToHDF5:
         )
 
         with h5py.File(output_h5, "r") as f:
-            dataset = f["step_0/point_data/temperature"]
+            dataset = f["point_data/temperature"]
             assert dataset.compression == "gzip"
             assert dataset.compression_opts == 9
 
@@ -203,7 +480,7 @@ class TestConvertVTSToHDF5:
         )
 
         with h5py.File(output_h5, "r") as f:
-            dataset = f["step_0/point_data/temperature"]
+            dataset = f["point_data/temperature"]
             assert dataset.compression is None
 
     def test_sequential_processing(self, temp_dir, sample_vts_files):
@@ -308,9 +585,225 @@ class TestConvertVTSToHDF5:
 
         # Parse and verify XDMF
         from lxml import etree
+
         tree = etree.parse(str(output_xdmf))
         root = tree.getroot()
 
         assert root.tag == "Xdmf"
         grids = tree.findall(".//Grid[@GridType='Uniform']")
         assert len(grids) == len(sample_vts_files)
+
+    def test_parallel_matches_sequential(self, temp_dir, sample_vts_files):
+        """Test that parallel and sequential conversions store the same data."""
+        outputs = {}
+        for jobs in (1, 2):
+            output_h5 = temp_dir / f"output_{jobs}.h5"
+            convert_vts_to_hdf5(
+                input_files=sample_vts_files,
+                output_file=output_h5,
+                xdmf_output=temp_dir / f"output_{jobs}.xdmf2",
+                jobs=jobs,
+                silent=True,
+            )
+            outputs[jobs] = output_h5
+
+        with h5py.File(outputs[1], "r") as seq, h5py.File(outputs[2], "r") as par:
+            path = "point_data/temperature"
+            np.testing.assert_array_equal(seq[path][...], par[path][...])
+
+    def test_parallel_gzip_precompressed(self, temp_dir, sample_vts_files):
+        """Test that worker-compressed gzip chunks read back like sequential ones."""
+        outputs = {}
+        for jobs in (1, 2):
+            output_h5 = temp_dir / f"output_{jobs}.h5"
+            convert_vts_to_hdf5(
+                input_files=sample_vts_files,
+                output_file=output_h5,
+                xdmf_output=temp_dir / f"output_{jobs}.xdmf2",
+                compression="gzip",
+                jobs=jobs,
+                silent=True,
+            )
+            outputs[jobs] = output_h5
+
+        with h5py.File(outputs[1], "r") as seq, h5py.File(outputs[2], "r") as par:
+            dataset = par["point_data/temperature"]
+            assert dataset.chunks == (1, 10, 10, 10)
+            assert dataset.compression == "gzip"
+            np.testing.assert_array_equal(
+                seq["point_data/temperature"][...], dataset[...]
+            )
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    @pytest.mark.parametrize("compression", ["blosc", "gzip"])
+    def test_vector_array(self, temp_dir, vector_vts_files, jobs, compression):
+        """Test that a vector array is stored and described with its components."""
+        from lxml import etree
+
+        output_h5 = temp_dir / "output.h5"
+        output_xdmf = temp_dir / "output.xdmf2"
+
+        convert_vts_to_hdf5(
+            input_files=vector_vts_files,
+            output_file=output_h5,
+            xdmf_output=output_xdmf,
+            compression=compression,
+            jobs=jobs,
+            silent=True,
+        )
+
+        tree = etree.parse(str(output_xdmf))
+        grids = tree.findall(".//Grid[@GridType='Uniform']")
+        assert len(grids) == 2
+        with h5py.File(output_h5, "r") as f:
+            assert f["point_data/velocity"].shape == (2, 2, 3, 4, 3)
+            for grid, vts_file in zip(grids, vector_vts_files):
+                expected = VTSReader(str(vts_file)).read()["point_data"]
+                for attribute in grid.findall("Attribute"):
+                    name = attribute.get("Name")
+                    hyperslab, data_item = attribute[0]
+                    # Resolve the XDMF selection against the HDF5 dataset
+                    rank = len(data_item.get("Dimensions").split())
+                    start, _, count = np.array(
+                        hyperslab.text.split(), dtype=int
+                    ).reshape(3, rank)
+                    dataset = f[data_item.text.split(":/")[1]]
+                    selected = dataset[
+                        tuple(slice(s, s + c) for s, c in zip(start, count))
+                    ]
+                    values = expected[name]
+                    assert attribute[0].get("Dimensions").split() == [
+                        str(n) for n in selected.shape[1:]
+                    ]
+                    np.testing.assert_array_equal(
+                        selected.reshape(values.shape), values
+                    )
+
+        velocity = tree.find(".//Attribute[@Name='velocity']")
+        assert velocity.get("AttributeType") == "Vector"
+        assert velocity[0].get("Dimensions") == "2 3 4 3"
+        temperature = tree.find(".//Attribute[@Name='temperature']")
+        assert temperature.get("AttributeType") == "Scalar"
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_float32_output(self, temp_dir, sample_vts_files, jobs):
+        """Test storing float64 input as float32 with matching XDMF precision."""
+        output_h5 = temp_dir / "output.h5"
+        output_xdmf = temp_dir / "output.xdmf2"
+
+        convert_vts_to_hdf5(
+            input_files=sample_vts_files,
+            output_file=output_h5,
+            xdmf_output=output_xdmf,
+            compression="gzip",
+            jobs=jobs,
+            silent=True,
+            output_dtype="float32",
+        )
+
+        with h5py.File(output_h5, "r") as f:
+            assert f["point_data/temperature"].dtype == np.float32
+            assert f["origin"].dtype == np.float64
+        # Geometry stays double precision, inline in the XDMF file
+        xdmf_text = output_xdmf.read_text()
+        assert 'Precision="4" Format="HDF"' in xdmf_text
+        assert 'Precision="8" Format="HDF"' not in xdmf_text
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_dimension_mismatch_aborts(self, temp_dir, mismatched_vts_files, jobs):
+        """Test that a dimension mismatch aborts and removes partial output."""
+        output_h5 = temp_dir / "output.h5"
+        output_xdmf = temp_dir / "output.xdmf2"
+
+        with pytest.raises(SystemExit):
+            convert_vts_to_hdf5(
+                input_files=mismatched_vts_files,
+                output_file=output_h5,
+                xdmf_output=output_xdmf,
+                jobs=jobs,
+                silent=True,
+            )
+
+        assert not output_h5.exists()
+        assert not output_xdmf.exists()
+
+    def test_dimension_mismatch_detected_before_reading(
+        self, temp_dir, mismatched_vts_files, monkeypatch
+    ):
+        """Test that mismatched headers abort before any file is decoded."""
+        import vts2h5.converter
+
+        def fail(filepath):
+            raise AssertionError(f"{filepath} should not be read")
+
+        monkeypatch.setattr(vts2h5.converter, "read_vts_file_worker", fail)
+        output_h5 = temp_dir / "output.h5"
+
+        with pytest.raises(SystemExit):
+            convert_vts_to_hdf5(
+                input_files=mismatched_vts_files,
+                output_file=output_h5,
+                xdmf_output=temp_dir / "output.xdmf2",
+                jobs=1,
+                silent=True,
+            )
+
+        assert not output_h5.exists()
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_missing_array_aborts(
+        self, temp_dir, missing_array_vts_files, jobs, capsys
+    ):
+        """Test that a file lacking an array aborts instead of storing zeros."""
+        output_h5 = temp_dir / "output.h5"
+        output_xdmf = temp_dir / "output.xdmf2"
+
+        with pytest.raises(SystemExit):
+            convert_vts_to_hdf5(
+                input_files=missing_array_vts_files,
+                output_file=output_h5,
+                xdmf_output=output_xdmf,
+                jobs=jobs,
+                silent=True,
+            )
+
+        err = capsys.readouterr().err
+        assert "Array mismatch in scalar_variables_step1.vts" in err
+        assert "point_data/pressure" in err
+        assert not output_h5.exists()
+        assert not output_xdmf.exists()
+
+    def test_abort_keeps_existing_output(self, temp_dir, mismatched_vts_files):
+        """Test that an abort before writing leaves an earlier output alone."""
+        output_h5 = temp_dir / "output.h5"
+        output_h5.write_bytes(b"earlier run")
+
+        with pytest.raises(SystemExit):
+            convert_vts_to_hdf5(
+                input_files=mismatched_vts_files,
+                output_file=output_h5,
+                xdmf_output=temp_dir / "output.xdmf2",
+                jobs=1,
+                silent=True,
+            )
+
+        assert output_h5.read_bytes() == b"earlier run"
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_corrupted_file_aborts(
+        self, temp_dir, sample_vts_files, invalid_vts_file, jobs
+    ):
+        """Test that an unreadable file aborts and removes partial output."""
+        output_h5 = temp_dir / "output.h5"
+        output_xdmf = temp_dir / "output.xdmf2"
+
+        with pytest.raises(SystemExit):
+            convert_vts_to_hdf5(
+                input_files=[*sample_vts_files, invalid_vts_file],
+                output_file=output_h5,
+                xdmf_output=output_xdmf,
+                jobs=jobs,
+                silent=True,
+            )
+
+        assert not output_h5.exists()
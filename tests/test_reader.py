@@ -43,6 +43,29 @@ class TestVTSReader:
         assert is_valid is False
         assert "Not a valid VTK file" in error
 
+    def test_validate_xml_wrong_vtk_type(self, temp_dir):
+        """Test XML validation with a VTK file of another dataset type."""
+        image_file = temp_dir / "image.vts"
+        image_file.write_text(
+            '<?xml version="1.0"?>\n<!-- written by hand -->\n'
+            '<VTKFile type="ImageData" version="0.1"><ImageData/></VTKFile>'
+        )
+
+        reader = VTSReader(str(image_file))
+        is_valid, error = reader.validate_xml()
+        assert is_valid is False
+        assert "type is ImageData" in error
+
+    def test_validate_xml_reads_header_only(self, sample_vts_file):
+        """Test that validation only parses the header of the file."""
+        content = sample_vts_file.read_bytes()
+        sample_vts_file.write_bytes(content[: len(content) // 2])
+
+        reader = VTSReader(str(sample_vts_file))
+        is_valid, error = reader.validate_xml()
+        assert is_valid is True
+        assert error is None
+
     def test_read_basic_structure(self, sample_vts_file):
         """Test reading basic structure from VTS file."""
         reader = VTSReader(str(sample_vts_file))
@@ -116,6 +139,30 @@ class TestVTSReader:
         assert "temperature" in info["point_arrays"]
         assert "pressure" in info["point_arrays"]
 
+    def test_get_info_and_read_share_parse(self, sample_vts_file, monkeypatch):
+        """Test that get_info and read parse the file only once."""
+        import vtk
+
+        parses = []
+        vtk_reader = vtk.vtkXMLStructuredGridReader
+
+        def counting_reader():
+            parses.append(1)
+            return vtk_reader()
+
+        monkeypatch.setattr(vtk, "vtkXMLStructuredGridReader", counting_reader)
+
+        with VTSReader(str(sample_vts_file)) as reader:
+            info = reader.get_info()
+            data = reader.read()
+            assert len(parses) == 1
+
+            reader.close()
+            reader.read()
+            assert len(parses) == 2
+
+        assert info["dimensions"] == data["dimensions"]
+
     def test_read_consistency(self, sample_vts_file):
         """Test that multiple reads return consistent data."""
         reader = VTSReader(str(sample_vts_file))
@@ -126,6 +173,26 @@ class TestVTSReader:
         assert data1["num_points"] == data2["num_points"]
         assert np.allclose(data1["points"], data2["points"])
 
+    def test_read_zero_copy(self, sample_vts_file):
+        """Test that arrays are views of the VTK buffers that outlive the reader."""
+        import gc
+
+        reader = VTSReader(str(sample_vts_file))
+        data1 = reader.read()
+        data2 = reader.read()
+
+        assert np.shares_memory(data1["points"], data2["points"])
+        assert np.shares_memory(
+            data1["point_data"]["temperature"], data2["point_data"]["temperature"]
+        )
+
+        expected = data1["point_data"]["temperature"].copy()
+        reader.close()
+        del reader, data2
+        gc.collect()
+
+        np.testing.assert_array_equal(data1["point_data"]["temperature"], expected)
+
     def test_bounds_format(self, sample_vts_file):
         """Test that bounds are in correct format."""
         reader = VTSReader(str(sample_vts_file))
@@ -154,3 +221,37 @@ class TestVTSReader:
             data = reader.read()
             assert data["num_points"] > 0
             assert len(data["point_data"]) > 0
+
+    def test_read_skips_string_arrays(self, temp_dir):
+        """Test that non-numeric arrays are skipped instead of failing."""
+        import vtk
+        from vtkmodules.util import numpy_support
+
+        points = vtk.vtkPoints()
+        for k in range(2):
+            for j in range(2):
+                for i in range(2):
+                    points.InsertNextPoint(i, j, k)
+        grid = vtk.vtkStructuredGrid()
+        grid.SetDimensions(2, 2, 2)
+        grid.SetPoints(points)
+
+        values = numpy_support.numpy_to_vtk(np.arange(8, dtype=np.float64))
+        values.SetName("values")
+        grid.GetPointData().AddArray(values)
+        labels = vtk.vtkStringArray()
+        labels.SetName("labels")
+        for i in range(8):
+            labels.InsertNextValue(f"p{i}")
+        grid.GetPointData().AddArray(labels)
+
+        vts_file = temp_dir / "strings.vts"
+        writer = vtk.vtkXMLStructuredGridWriter()
+        writer.SetFileName(str(vts_file))
+        writer.SetInputData(grid)
+        writer.Write()
+
+        data = VTSReader(str(vts_file)).read()
+
+        assert list(data["point_data"]) == ["values"]
+        np.testing.assert_array_equal(data["point_data"]["values"], np.arange(8))
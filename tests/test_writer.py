@@ -3,10 +3,11 @@
 from pathlib import Path
 
 import h5py
+import hdf5plugin
 import numpy as np
 import pytest
 
-from vts2h5.writer import HDF5Writer
+from vts2h5.writer import HDF5Writer, chunk_shape, encode_time_slab
 
 
 class TestHDF5Writer:
@@ -18,8 +19,8 @@ class TestHDF5Writer:
         writer = HDF5Writer(str(output_file))
 
         assert writer.filepath == output_file
-        assert writer.compression == "gzip"
-        assert writer.compression_opts == 4
+        assert writer.compression == "blosc"
+        assert writer.compression_opts == 5
         assert writer.mode == "w"
         assert writer.file is None
 
@@ -90,12 +91,152 @@ class TestHDF5Writer:
         grid_list = [sample_grid_data, sample_grid_data, sample_grid_data]
 
         with HDF5Writer(str(output_file)) as writer:
-            writer.write_multiple(grid_list, start_index=0)
+            writer.write_multiple(grid_list, start_index=5)
+
+        nx, ny, nz = sample_grid_data["dimensions"]
+        with h5py.File(output_file, "r") as f:
+            assert "step_0" not in f
+            assert f["point_data/temperature"].shape == (3, nz, ny, nx)
+            assert list(f["time_steps"][...]) == [5, 6, 7]
+
+    def test_write_multiple_no_resize(self, temp_dir, sample_grid_data):
+        """Test that write_multiple allocates fixed-size datasets."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.write_multiple([sample_grid_data, sample_grid_data])
+
+        with h5py.File(output_file, "r") as f:
+            dataset = f["point_data/temperature"]
+            assert dataset.maxshape == dataset.shape
+
+    def test_write_multiple_mixed_dimensions(self, temp_dir, sample_grid_data):
+        """Test that grids of different sizes fall back to step groups."""
+        output_file = temp_dir / "test.h5"
+        small_grid_data = dict(
+            sample_grid_data,
+            dimensions=[5, 4, 2],
+            point_data={"temperature": np.zeros(40)},
+        )
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.write_multiple([sample_grid_data, small_grid_data])
 
         with h5py.File(output_file, "r") as f:
             assert "step_0" in f
             assert "step_1" in f
-            assert "step_2" in f
+            assert "time_steps" not in f
+
+    def test_write_multiple_twice(self, temp_dir, sample_grid_data):
+        """Test that a time series cannot be extended by a second call."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.write_multiple([sample_grid_data, sample_grid_data])
+            with pytest.raises(ValueError, match="single write_multiple call"):
+                writer.write_multiple([sample_grid_data], start_index=2)
+
+        with h5py.File(output_file, "r") as f:
+            assert "step_2" not in f
+            assert f["point_data/temperature"].shape[0] == 2
+
+    def test_write_multiple_after_step_groups(self, temp_dir, sample_grid_data):
+        """Test that a file with step groups keeps getting step groups."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.write(sample_grid_data, time_step=0)
+            writer.write_multiple([sample_grid_data, sample_grid_data], start_index=1)
+
+        with h5py.File(output_file, "r") as f:
+            assert {"step_0", "step_1", "step_2"} <= set(f)
+            assert "time_steps" not in f
+
+    @pytest.mark.parametrize("extra_first", [False, True])
+    def test_write_multiple_differing_arrays(self, temp_dir, sample_grid_data, extra_first):
+        """Test that grids of equal dimensions but other arrays get step groups."""
+        output_file = temp_dir / "test.h5"
+        partial = dict(
+            sample_grid_data,
+            point_data={"temperature": sample_grid_data["point_data"]["temperature"]},
+        )
+        grids = [sample_grid_data, partial] if extra_first else [partial, sample_grid_data]
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.write_multiple(grids)
+
+        with h5py.File(output_file, "r") as f:
+            assert "time_steps" not in f
+            assert "point_data" not in f
+            assert set(f["step_0/point_data"]) == set(grids[0]["point_data"])
+            assert set(f["step_1/point_data"]) == set(grids[1]["point_data"])
+
+    def test_write_multiple_differing_components(self, temp_dir, sample_grid_data):
+        """Test that grids whose arrays differ in components get step groups."""
+        output_file = temp_dir / "test.h5"
+        vector_grid_data = dict(
+            sample_grid_data,
+            point_data=dict(sample_grid_data["point_data"], pressure=np.random.rand(1000, 3)),
+        )
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.write_multiple([sample_grid_data, vector_grid_data])
+
+        with h5py.File(output_file, "r") as f:
+            assert "time_steps" not in f
+            assert f["step_0/point_data/pressure"].shape == (10, 10, 10)
+            assert f["step_1/point_data/pressure"].shape == (10, 10, 10, 3)
+
+    def test_write_multiple_parallel(self, temp_dir, sample_vts_files, monkeypatch):
+        """Test converting files in parallel into externally linked step files."""
+        from vts2h5.reader import VTSReader
+
+        output_file = temp_dir / "out" / "test.h5"
+        output_file.parent.mkdir()
+
+        with HDF5Writer(str(output_file), compression="gzip") as writer:
+            shards = writer.write_multiple_parallel(sample_vts_files, workers=2)
+
+        assert [shard.name for shard in shards] == [
+            "test_step_0.h5",
+            "test_step_1.h5",
+            "test_step_2.h5",
+        ]
+
+        # Links resolve relative to the output file, not the working directory
+        monkeypatch.chdir(temp_dir)
+        with h5py.File(output_file, "r") as f:
+            assert "origin" in f
+            for i, vts_file in enumerate(sample_vts_files):
+                expected = VTSReader(str(vts_file)).read()["point_data"]["temperature"]
+                dataset = f[f"step_{i}/point_data/temperature"]
+                np.testing.assert_array_equal(dataset[...].ravel(), expected)
+
+    def test_write_time_series_method(self, temp_dir, sample_grid_data):
+        """Test write_time_series method."""
+        output_file = temp_dir / "test.h5"
+        second = dict(sample_grid_data)
+        second["point_data"] = {
+            name: array + 1 for name, array in sample_grid_data["point_data"].items()
+        }
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.write_time_series([sample_grid_data, second], [0, 100])
+
+        with h5py.File(output_file, "r") as f:
+            dataset = f["point_data/temperature"]
+            expected = sample_grid_data["point_data"]["temperature"].reshape(10, 10, 10)
+            assert dataset.shape == (2, 10, 10, 10)
+            np.testing.assert_array_equal(dataset[0], expected)
+            np.testing.assert_array_equal(dataset[1], expected + 1)
+            assert list(f["time_steps"][:]) == [0, 100]
+            assert "step_0" not in f
+
+    def test_write_time_series_step_count(self, temp_dir, sample_grid_data):
+        """Test that write_time_series rejects mismatched time steps."""
+        with HDF5Writer(str(temp_dir / "test.h5")) as writer:
+            with pytest.raises(ValueError, match="time steps"):
+                writer.write_time_series([sample_grid_data], [0, 100])
 
     def test_origin_and_spacing(self, temp_dir, sample_grid_data):
         """Test that origin and spacing are calculated correctly."""
@@ -112,6 +253,9 @@ class TestHDF5Writer:
             assert len(spacing) == 3
             assert all(isinstance(x, (float, np.floating)) for x in origin)
             assert all(isinstance(x, (float, np.floating)) for x in spacing)
+            np.testing.assert_allclose(origin, [0.0, 0.0, 0.0])
+            np.testing.assert_allclose(spacing, [0.1, 0.1, 0.1])
+            assert f["origin"].compression is None
 
     def test_data_reshaping(self, temp_dir, sample_grid_data):
         """Test that data is reshaped correctly for XDMF."""
@@ -128,6 +272,22 @@ class TestHDF5Writer:
             expected_shape = (dims[2], dims[1], dims[0])
             assert temp_data.shape == expected_shape
 
+    def test_non_contiguous_arrays(self, temp_dir, sample_grid_data):
+        """Test that strided array views are written with their values."""
+        output_file = temp_dir / "test.h5"
+        strided = np.random.rand(2 * sample_grid_data["num_points"])[::2]
+        sample_grid_data["point_data"] = {"temperature": strided}
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.write(sample_grid_data, time_step=0)
+            writer.init_time_series(sample_grid_data, [0])
+            writer.write(sample_grid_data, time_step_index=0)
+
+        with h5py.File(output_file, "r") as f:
+            expected = strided.reshape(10, 10, 10)
+            np.testing.assert_array_equal(f["step_0/point_data/temperature"], expected)
+            np.testing.assert_array_equal(f["point_data/temperature"][0], expected)
+
     def test_compression_applied(self, temp_dir, sample_grid_data):
         """Test that compression is applied to datasets."""
         output_file = temp_dir / "test.h5"
@@ -139,6 +299,117 @@ class TestHDF5Writer:
             dataset = f["point_data/temperature"]
             assert dataset.compression == "gzip"
             assert dataset.compression_opts == 9
+            assert dataset.shuffle
+
+    @pytest.mark.parametrize(
+        "compression, level, shuffle",
+        [
+            (None, None, False),
+            ("lzf", None, True),
+            ("gzip", 4, True),
+            ("blosc:lz4", 9, True),
+        ],
+    )
+    def test_compression_matrix(
+        self, temp_dir, sample_grid_data, compression, level, shuffle
+    ):
+        """Test that each compression round-trips and shuffles where it should."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(
+            str(output_file), compression=compression, compression_opts=level
+        ) as writer:
+            writer.init_time_series(sample_grid_data, [0])
+            writer.write(sample_grid_data, time_step_index=0)
+
+        with h5py.File(output_file, "r") as f:
+            dataset = f["point_data/temperature"]
+            np.testing.assert_array_equal(
+                dataset[0].ravel(), sample_grid_data["point_data"]["temperature"]
+            )
+            if compression and compression.startswith("blosc"):
+                # Blosc shuffles inside the codec: clevel, shuffle, compressor
+                values = dataset.id.get_create_plist().get_filter(0)[2]
+                assert values[4:6] == (level, int(shuffle))
+            else:
+                assert dataset.compression == compression
+                assert dataset.shuffle == shuffle
+
+    def test_default_blosc_compression(self, temp_dir, sample_grid_data):
+        """Test that Blosc is the default compression filter."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.write(sample_grid_data)
+
+        with h5py.File(output_file, "r") as f:
+            dataset = f["point_data/temperature"]
+            plist = dataset.id.get_create_plist()
+            assert plist.get_filter(0)[0] == hdf5plugin.BLOSC_ID
+            np.testing.assert_array_equal(
+                dataset[...].ravel(), sample_grid_data["point_data"]["temperature"]
+            )
+
+    def test_explicit_blosc_codec(self, temp_dir, sample_grid_data):
+        """Test selecting a Blosc codec with the 'blosc:<codec>' syntax."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file), compression="blosc:zstd") as writer:
+            assert writer.compression_opts == 5
+            writer.write(sample_grid_data)
+
+        with h5py.File(output_file, "r") as f:
+            filter_id, _, values, _ = (
+                f["point_data/temperature"].id.get_create_plist().get_filter(0)
+            )
+            assert filter_id == hdf5plugin.BLOSC_ID
+            # clevel, shuffle, compressor code (5 = zstd)
+            assert values[4:] == (5, 1, 5)
+
+    def test_unknown_blosc_codec(self, temp_dir):
+        """Test that an unknown 'blosc:<codec>' name is rejected."""
+        with pytest.raises(ValueError, match="Unknown Blosc codec"):
+            HDF5Writer(str(temp_dir / "test.h5"), compression="blosc:brotli")
+
+    def test_gzip_default_level(self, temp_dir):
+        """Test that gzip falls back to a fast compression level."""
+        output_file = temp_dir / "test.h5"
+        writer = HDF5Writer(str(output_file), compression="gzip")
+
+        assert writer.compression_opts == 1
+
+    def test_lzf_ignores_level(self, temp_dir, sample_grid_data):
+        """Test that LZF writes succeed even when a level is given."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file), compression="lzf", compression_opts=4) as writer:
+            writer.write(sample_grid_data)
+
+        with h5py.File(output_file, "r") as f:
+            assert f["point_data/temperature"].compression == "lzf"
+            assert f["point_data/temperature"].shuffle
+
+    def test_chunk_cache(self, temp_dir):
+        """Test that the file is opened with an enlarged chunk cache."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file), cache_bytes=32 * 1024 * 1024) as writer:
+            _, nslots, nbytes, w0 = writer.file.id.get_access_plist().get_cache()
+
+        assert nbytes == 32 * 1024 * 1024
+        assert nslots == 100003
+        assert w0 == 1.0
+
+    def test_chunk_covers_whole_step(self, temp_dir, sample_grid_data):
+        """Test that a small time step is stored as a single chunk."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.write(sample_grid_data, time_step=0)
+
+        with h5py.File(output_file, "r") as f:
+            dataset = f["step_0/point_data/temperature"]
+            assert dataset.chunks == dataset.shape
 
     def test_no_compression(self, temp_dir, sample_grid_data):
         """Test writing without compression."""
@@ -161,6 +432,20 @@ class TestHDF5Writer:
         writer.close()
         assert writer.file is None
 
+    def test_close_drop_page_cache(self, temp_dir, sample_grid_data):
+        """Test that dropping the page cache on close keeps the file intact."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file), drop_page_cache=True) as writer:
+            writer.write(sample_grid_data)
+        assert writer.file is None
+
+        with h5py.File(output_file, "r") as f:
+            np.testing.assert_array_equal(
+                f["point_data/temperature"][...].ravel(),
+                sample_grid_data["point_data"]["temperature"],
+            )
+
     def test_get_file_size(self, temp_dir, sample_grid_data):
         """Test getting file size."""
         output_file = temp_dir / "test.h5"
@@ -211,6 +496,227 @@ class TestHDF5Writer:
             assert "cell_data" in f
             assert "cell_temp" in f["cell_data"]
 
+    def test_init_time_series(self, temp_dir, sample_grid_data):
+        """Test preallocating fixed-size time series datasets."""
+        sample_grid_data["cell_data"] = {
+            "cell_temp": np.random.rand(sample_grid_data["num_cells"])
+        }
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.init_time_series(sample_grid_data, [0, 100, 200])
+
+        with h5py.File(output_file, "r") as f:
+            np.testing.assert_array_equal(f["time_steps"][...], [0, 100, 200])
+            assert "origin" in f
+            assert "spacing" in f
+            assert f["point_data/temperature"].shape == (3, 10, 10, 10)
+            assert f["point_data/temperature"].maxshape == (3, 10, 10, 10)
+            assert f["cell_data/cell_temp"].shape == (3, 9, 9, 9)
+
+    def test_write_time_step_index(self, temp_dir, sample_grid_data):
+        """Test writing time steps into preallocated datasets."""
+        output_file = temp_dir / "test.h5"
+        second = dict(sample_grid_data)
+        second["point_data"] = {
+            name: array * 2 for name, array in sample_grid_data["point_data"].items()
+        }
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.init_time_series(sample_grid_data, [0, 100])
+            writer.write(sample_grid_data, time_step_index=0)
+            writer.write(second, time_step_index=1)
+
+        with h5py.File(output_file, "r") as f:
+            dataset = f["point_data/temperature"]
+            expected = sample_grid_data["point_data"]["temperature"].reshape(10, 10, 10)
+            np.testing.assert_array_equal(dataset[0], expected)
+            np.testing.assert_array_equal(dataset[1], expected * 2)
+            assert "step_0" not in f
+
+    def test_swmr_concurrent_read(self, temp_dir, sample_grid_data):
+        """Test that an SWMR reader sees a time step while the writer is open."""
+        output_file = temp_dir / "test.h5"
+        expected = sample_grid_data["point_data"]["temperature"].reshape(10, 10, 10)
+
+        with HDF5Writer(str(output_file), swmr=True) as writer:
+            writer.init_time_series(sample_grid_data, [0, 100])
+            writer.write(sample_grid_data, time_step_index=0)
+
+            with h5py.File(output_file, "r", swmr=True) as f:
+                np.testing.assert_array_equal(f["point_data/temperature"][0], expected)
+
+            writer.write(sample_grid_data, time_step_index=1)
+
+    def test_swmr_one_step_chunks(self, temp_dir, sample_grid_data):
+        """Test that SWMR mode keeps each time step in its own chunks."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file), swmr=True) as writer:
+            writer.init_time_series(sample_grid_data, list(range(4)))
+
+        with h5py.File(output_file, "r") as f:
+            assert f["point_data/temperature"].chunks == (1, 10, 10, 10)
+
+    def test_time_series_chunks_group_steps(self, temp_dir, sample_grid_data):
+        """Test that small time steps share chunks along the time axis."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.init_time_series(sample_grid_data, list(range(4)))
+
+        with h5py.File(output_file, "r") as f:
+            assert f["point_data/temperature"].chunks == (4, 10, 10, 10)
+
+    def test_time_series_chunks_fit_cache(self, temp_dir, sample_grid_data):
+        """Test that chunks never outgrow a small chunk cache."""
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(str(output_file), cache_bytes=16 * 1024) as writer:
+            writer.init_time_series(sample_grid_data, list(range(4)))
+
+        with h5py.File(output_file, "r") as f:
+            chunks = f["point_data/temperature"].chunks
+            assert np.prod(chunks) * 8 <= 16 * 1024
+
+    def test_write_unknown_array_in_time_series(self, temp_dir, sample_grid_data):
+        """Test that arrays missing from the first time step are rejected."""
+        output_file = temp_dir / "test.h5"
+        extra = dict(sample_grid_data)
+        extra["point_data"] = {
+            **sample_grid_data["point_data"],
+            "density": np.zeros(1000),
+        }
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.init_time_series(sample_grid_data, [0, 100])
+            with pytest.raises(ValueError, match="point_data/density"):
+                writer.write(extra, time_step_index=1)
+
+    def test_write_missing_array_in_time_series(self, temp_dir, sample_grid_data):
+        """Test that a time step lacking an array is rejected, not zero-filled."""
+        output_file = temp_dir / "test.h5"
+        partial = dict(sample_grid_data)
+        partial["point_data"] = {
+            "temperature": sample_grid_data["point_data"]["temperature"]
+        }
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.init_time_series(sample_grid_data, [0, 100])
+            writer.write(sample_grid_data, time_step_index=0)
+            with pytest.raises(ValueError, match="missing.*point_data/pressure"):
+                writer.write(partial, time_step_index=1)
+
+    def test_write_reshaped_array_in_time_series(self, temp_dir, sample_grid_data):
+        """Test that an array whose components changed is rejected."""
+        output_file = temp_dir / "test.h5"
+        vector = dict(sample_grid_data)
+        vector["point_data"] = {
+            **sample_grid_data["point_data"],
+            "pressure": np.zeros((1000, 3)),
+        }
+
+        with HDF5Writer(str(output_file)) as writer:
+            writer.init_time_series(sample_grid_data, [0, 100])
+            with pytest.raises(ValueError, match="point_data/pressure"):
+                writer.write(vector, time_step_index=1)
+
+    def test_direct_chunks(self, temp_dir, sample_grid_data):
+        """Test writing precompressed gzip chunks without the filter pipeline."""
+        output_file = temp_dir / "test.h5"
+        grid_data = dict(sample_grid_data)
+        grid_data["encoded_chunks"] = encode_time_slab(grid_data, 4)
+
+        with HDF5Writer(
+            str(output_file), compression="gzip", compression_opts=4, direct_chunks=True
+        ) as writer:
+            assert writer.precompress_level == 4
+            writer.init_time_series(grid_data, [0, 100])
+            writer.write(grid_data, time_step_index=1)
+
+        with h5py.File(output_file, "r") as f:
+            dataset = f["point_data/temperature"]
+            expected = sample_grid_data["point_data"]["temperature"].reshape(10, 10, 10)
+            assert dataset.chunks == (1, 10, 10, 10)
+            np.testing.assert_array_equal(dataset[1], expected)
+
+    def test_output_dtype(self, temp_dir, sample_grid_data):
+        """Test storing floating point arrays as float32."""
+        output_file = temp_dir / "test.h5"
+        sample_grid_data["cell_data"] = {"grain_id": np.arange(729, dtype=np.int32)}
+
+        with HDF5Writer(str(output_file), output_dtype=np.float32) as writer:
+            writer.write(sample_grid_data, time_step=0)
+            writer.init_time_series(sample_grid_data, [0])
+            writer.write(sample_grid_data, time_step_index=0)
+
+        with h5py.File(output_file, "r") as f:
+            expected = sample_grid_data["point_data"]["temperature"].reshape(10, 10, 10)
+            for path in ("step_0/point_data/temperature", "point_data/temperature"):
+                assert f[path].dtype == np.float32
+            np.testing.assert_array_equal(
+                f["point_data/temperature"][0], expected.astype(np.float32)
+            )
+            assert f["cell_data/grain_id"].dtype == np.int32
+            assert f["origin"].dtype == np.float64
+
+    def test_output_dtype_direct_chunks(self, temp_dir, sample_grid_data):
+        """Test precompressed chunks encoded with the output dtype."""
+        output_file = temp_dir / "test.h5"
+        grid_data = dict(sample_grid_data)
+        grid_data["encoded_chunks"] = encode_time_slab(grid_data, 4, np.float32)
+
+        with HDF5Writer(
+            str(output_file),
+            compression="gzip",
+            compression_opts=4,
+            direct_chunks=True,
+            output_dtype="float32",
+        ) as writer:
+            writer.init_time_series(grid_data, [0])
+            writer.write(grid_data, time_step_index=0)
+
+        with h5py.File(output_file, "r") as f:
+            expected = sample_grid_data["point_data"]["temperature"].reshape(10, 10, 10)
+            np.testing.assert_array_equal(
+                f["point_data/temperature"][0], expected.astype(np.float32)
+            )
+
+    def test_output_dtype_must_be_float(self, temp_dir):
+        """Test that integer output dtypes are rejected."""
+        with pytest.raises(ValueError, match="floating point"):
+            HDF5Writer(str(temp_dir / "test.h5"), output_dtype=np.int16)
+
+    def test_direct_chunks_padded_edge(self, temp_dir):
+        """Test that edge chunks of a split time step are padded correctly."""
+        nx, ny, nz = 1000, 1000, 2
+        values = np.arange(nx * ny * nz, dtype=np.float64)
+        grid_data = {
+            "dimensions": [nx, ny, nz],
+            "point_data": {"values": values},
+            "cell_data": {},
+        }
+        grid_data["encoded_chunks"] = encode_time_slab(grid_data, 1)
+        output_file = temp_dir / "test.h5"
+
+        with HDF5Writer(
+            str(output_file), compression="gzip", direct_chunks=True
+        ) as writer:
+            writer.init_time_series(grid_data, [0])
+            writer.write(grid_data, time_step_index=0)
+
+        with h5py.File(output_file, "r") as f:
+            dataset = f["point_data/values"]
+            assert ny % dataset.chunks[2] != 0
+            np.testing.assert_array_equal(dataset[0], values.reshape(nz, ny, nx))
+
+    def test_direct_chunks_only_for_gzip(self, temp_dir):
+        """Test that other compressions keep the filter pipeline."""
+        writer = HDF5Writer(str(temp_dir / "test.h5"), direct_chunks=True)
+
+        assert writer.direct_chunks is False
+        assert writer.precompress_level is None
+
     def test_write_error_handling(self, temp_dir):
         """Test error handling during write."""
         output_file = temp_dir / "test.h5"
@@ -221,3 +727,31 @@ class TestHDF5Writer:
         with HDF5Writer(str(output_file)) as writer:
             with pytest.raises(RuntimeError):
                 writer.write(invalid_data)
+
+
+class TestChunkShape:
+    """Test cases for chunk_shape function."""
+
+    def test_small_array_single_chunk(self):
+        """Test that arrays under the limit are one chunk."""
+        assert chunk_shape((10, 10, 10), 8) == (10, 10, 10)
+
+    def test_split_along_slowest_axis(self):
+        """Test that large arrays are split into whole-plane slabs."""
+        chunks = chunk_shape((512, 512, 512), 8, max_bytes=4 * 1024 * 1024)
+
+        assert chunks == (2, 512, 512)
+
+    def test_default_limit_one_mebibyte(self):
+        """Test that default chunks are whole z-slabs of at most 1 MiB."""
+        chunks = chunk_shape((256, 256, 256), 8)
+
+        assert chunks == (2, 256, 256)
+
+    def test_split_large_plane(self):
+        """Test that a plane larger than the limit is split further."""
+        chunks = chunk_shape((4, 4096, 4096), 8, max_bytes=1024 * 1024)
+
+        assert chunks[0] == 1
+        assert chunks[2] == 4096
+        assert chunks[1] * chunks[2] * 8 <= 1024 * 1024
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 from lxml import etree
 
@@ -43,19 +44,9 @@ class TestXDMFGenerator:
 
         assert xdmf_file.exists()
 
-    def test_xdmf_structure(self, temp_dir, sample_grid_data):
+    def test_xdmf_structure(self, xdmf_tree):
         """Test basic XDMF XML structure."""
-        h5_file = temp_dir / "test.h5"
-        xdmf_file = temp_dir / "test.xdmf2"
-
-        with HDF5Writer(str(h5_file)) as writer:
-            writer.write(sample_grid_data)
-
-        generator = XDMFGenerator(str(h5_file), sample_grid_data)
-        generator.generate(str(xdmf_file))
-
-        tree = etree.parse(str(xdmf_file))
-        root = tree.getroot()
+        root = xdmf_tree.getroot()
 
         assert root.tag == "Xdmf"
         assert root.get("Version") == "3.0"
@@ -63,41 +54,21 @@ class TestXDMFGenerator:
         domain = root.find("Domain")
         assert domain is not None
 
-    def test_single_grid_topology(self, temp_dir, sample_grid_data):
+    def test_single_grid_topology(self, xdmf_tree, shared_grid_data):
         """Test topology in single grid."""
-        h5_file = temp_dir / "test.h5"
-        xdmf_file = temp_dir / "test.xdmf2"
-
-        with HDF5Writer(str(h5_file)) as writer:
-            writer.write(sample_grid_data)
-
-        generator = XDMFGenerator(str(h5_file), sample_grid_data)
-        generator.generate(str(xdmf_file))
-
-        tree = etree.parse(str(xdmf_file))
-        topology = tree.find(".//Topology")
+        topology = xdmf_tree.find(".//Topology")
 
         assert topology is not None
         assert topology.get("TopologyType") == "3DRectMesh"
 
         # Check dimensions (should be Z Y X order)
-        dims = sample_grid_data["dimensions"]
+        dims = shared_grid_data["dimensions"]
         expected_dims = f"{dims[2]} {dims[1]} {dims[0]}"
         assert topology.get("Dimensions") == expected_dims
 
-    def test_single_grid_geometry(self, temp_dir, sample_grid_data):
+    def test_single_grid_geometry(self, xdmf_tree):
         """Test geometry with ORIGIN_DXDYDZ."""
-        h5_file = temp_dir / "test.h5"
-        xdmf_file = temp_dir / "test.xdmf2"
-
-        with HDF5Writer(str(h5_file)) as writer:
-            writer.write(sample_grid_data)
-
-        generator = XDMFGenerator(str(h5_file), sample_grid_data)
-        generator.generate(str(xdmf_file))
-
-        tree = etree.parse(str(xdmf_file))
-        geometry = tree.find(".//Geometry")
+        geometry = xdmf_tree.find(".//Geometry")
 
         assert geometry is not None
         assert geometry.get("GeometryType") == "ORIGIN_DXDYDZ"
@@ -110,19 +81,9 @@ class TestXDMFGenerator:
         assert "Origin" in names
         assert "Spacing" in names
 
-    def test_point_attributes(self, temp_dir, sample_grid_data):
+    def test_point_attributes(self, xdmf_tree):
         """Test point data attributes."""
-        h5_file = temp_dir / "test.h5"
-        xdmf_file = temp_dir / "test.xdmf2"
-
-        with HDF5Writer(str(h5_file)) as writer:
-            writer.write(sample_grid_data)
-
-        generator = XDMFGenerator(str(h5_file), sample_grid_data)
-        generator.generate(str(xdmf_file))
-
-        tree = etree.parse(str(xdmf_file))
-        attributes = tree.findall(".//Attribute")
+        attributes = xdmf_tree.findall(".//Attribute")
 
         assert len(attributes) >= 2
 
@@ -214,31 +175,161 @@ class TestXDMFGenerator:
         for i, time_elem in enumerate(time_elements):
             assert time_elem.get("Value") == str(int(time_values[i]))
 
-    def test_hdf5_paths(self, temp_dir, sample_grid_data):
-        """Test HDF5 file paths in DataItems."""
+    def test_time_series_hyperslabs(self, temp_dir, sample_grid_data):
+        """Test that time series datasets are referenced through HyperSlabs."""
         h5_file = temp_dir / "test.h5"
         xdmf_file = temp_dir / "test.xdmf2"
+        time_steps = [0, 100, 200]
 
         with HDF5Writer(str(h5_file)) as writer:
-            writer.write(sample_grid_data)
+            writer.init_time_series(sample_grid_data, time_steps)
+            for i in range(len(time_steps)):
+                writer.write(sample_grid_data, time_step_index=i)
 
-        generator = XDMFGenerator(str(h5_file), sample_grid_data)
-        generator.generate(str(xdmf_file))
+        XDMFGenerator.generate_temporal_collection(
+            str(h5_file),
+            str(xdmf_file),
+            time_steps=time_steps,
+            dimensions=sample_grid_data["dimensions"],
+            point_arrays=["temperature"],
+            time_series=True,
+        )
 
         tree = etree.parse(str(xdmf_file))
-        data_items = tree.findall(".//DataItem[@Format='HDF']")
+        hyperslabs = tree.findall(".//Attribute/DataItem[@ItemType='HyperSlab']")
+
+        assert len(hyperslabs) == len(time_steps)
+        for i, hyperslab in enumerate(hyperslabs):
+            selection, source = hyperslab.findall("DataItem")
+            assert hyperslab.get("Dimensions") == "10 10 10"
+            assert selection.text.split()[:4] == [str(i), "0", "0", "0"]
+            assert source.get("Dimensions") == "3 10 10 10"
+            assert source.text == f"{h5_file.name}:/point_data/temperature"
+
+    def test_multi_component_attributes(self, temp_dir):
+        """Test that multi-component arrays get their type and component axis."""
+        xdmf_file = temp_dir / "test.xdmf2"
+
+        XDMFGenerator.generate_temporal_collection(
+            "test.h5",
+            str(xdmf_file),
+            time_steps=[0, 100],
+            dimensions=(4, 3, 2),
+            point_arrays=["temperature", "velocity"],
+            cell_arrays=["stress", "flags"],
+            time_series=True,
+            components={
+                "point_data/velocity": 3,
+                "cell_data/stress": 9,
+                "cell_data/flags": 2,
+            },
+        )
+
+        tree = etree.parse(str(xdmf_file))
+        grid = tree.findall(".//Grid[@GridType='Uniform']")[1]
+        expected = {
+            "temperature": ("Scalar", "2 3 4"),
+            "velocity": ("Vector", "2 3 4 3"),
+            "stress": ("Tensor", "1 2 3 9"),
+            "flags": ("Matrix", "1 2 3 2"),
+        }
+        for attribute in grid.findall("Attribute"):
+            attribute_type, dims = expected[attribute.get("Name")]
+            hyperslab = attribute[0]
+            selection, source = hyperslab.findall("DataItem")
+            rank = len(dims.split()) + 1
+            assert attribute.get("AttributeType") == attribute_type
+            assert hyperslab.get("Dimensions") == dims
+            assert selection.get("Dimensions") == f"3 {rank}"
+            assert selection.text.split() == (
+                ["1"] + ["0"] * (rank - 1) + ["1"] * rank + ["1"] + dims.split()
+            )
+            assert source.get("Dimensions") == f"2 {dims}"
+
+    def test_inline_geometry(self, temp_dir, sample_grid_data):
+        """Test that origin and spacing values are written inline."""
+        xdmf_file = temp_dir / "test.xdmf2"
+
+        XDMFGenerator.generate_temporal_collection(
+            "test.h5",
+            str(xdmf_file),
+            time_steps=[0, 100],
+            dimensions=sample_grid_data["dimensions"],
+            point_arrays=["temperature"],
+            origin=[0.0, 1.0, 2.0],
+            spacing=(0.1, 0.1, 0.5),
+        )
+
+        tree = etree.parse(str(xdmf_file))
+        for geometry in tree.findall(".//Geometry"):
+            origin, spacing = geometry.findall("DataItem")
+            assert origin.get("Format") == "XML"
+            assert origin.text == "0.0 1.0 2.0"
+            assert spacing.get("Format") == "XML"
+            assert spacing.text == "0.1 0.1 0.5"
+
+    def test_single_precision(self, temp_dir, sample_grid_data):
+        """Test that float32 arrays are described with Precision 4."""
+        xdmf_file = temp_dir / "test.xdmf2"
+
+        XDMFGenerator.generate_temporal_collection(
+            "test.h5",
+            str(xdmf_file),
+            time_steps=[0, 100],
+            dimensions=sample_grid_data["dimensions"],
+            point_arrays=["temperature"],
+            time_series=True,
+            precision=4,
+        )
+
+        tree = etree.parse(str(xdmf_file))
+        sources = tree.findall(".//Attribute/DataItem/DataItem[@Format='HDF']")
+        assert len(sources) == 2
+        assert all(source.get("Precision") == "4" for source in sources)
+        geometry_items = tree.findall(".//Geometry/DataItem")
+        assert all(item.get("Precision") == "8" for item in geometry_items)
+
+    def test_step_grids_reference_own_step(self, temp_dir, sample_grid_data):
+        """Test that every step grid points at its own step group."""
+        xdmf_file = temp_dir / "test.xdmf2"
+        time_steps = [0, 100, 200]
+
+        XDMFGenerator.generate_temporal_collection(
+            "test.h5",
+            str(xdmf_file),
+            time_steps=time_steps,
+            dimensions=sample_grid_data["dimensions"],
+            point_arrays=["temperature", "pressure"],
+            cell_arrays=["cell_temp"],
+        )
+
+        tree = etree.parse(str(xdmf_file))
+        grids = tree.findall(".//Grid[@GridType='Uniform']")
+
+        assert [grid.get("Name") for grid in grids] == ["Step_0", "Step_100", "Step_200"]
+        for grid, step in zip(grids, time_steps):
+            paths = [item.text for item in grid.findall("Attribute/DataItem")]
+            assert paths == [
+                f"test.h5:/step_{step}/point_data/temperature",
+                f"test.h5:/step_{step}/point_data/pressure",
+                f"test.h5:/step_{step}/cell_data/cell_temp",
+            ]
+
+    def test_hdf5_paths(self, xdmf_tree, pre_written_h5):
+        """Test HDF5 file paths in DataItems."""
+        data_items = xdmf_tree.findall(".//DataItem[@Format='HDF']")
 
         assert len(data_items) > 0
 
         # Check that all paths reference the correct HDF5 file
         for item in data_items:
-            assert h5_file.name in item.text
+            assert pre_written_h5.name in item.text
 
     def test_cell_attributes(self, temp_dir, sample_grid_data):
         """Test cell data attributes."""
         # Add cell data
         sample_grid_data["cell_data"] = {
-            "cell_temp": [1.0] * sample_grid_data["num_cells"]
+            "cell_temp": np.ones(sample_grid_data["num_cells"])
         }
 
         h5_file = temp_dir / "test.h5"
@@ -285,15 +376,38 @@ class TestXDMFGenerator:
 
         assert len(grids) == len(time_steps)
 
-    def test_xml_validity(self, temp_dir, sample_grid_data):
+    @pytest.mark.parametrize("time_steps", [None, [100], [0, 100, 200]])
+    def test_generate_fast_matches_generate(
+        self, temp_dir, sample_grid_data, time_steps
+    ):
+        """Test that the string template path writes the same file."""
+        sample_grid_data["point_data"]["a<b&\"c\""] = sample_grid_data["point_data"][
+            "temperature"
+        ]
+        generator = XDMFGenerator(str(temp_dir / "test.h5"), sample_grid_data)
+
+        generator.generate(str(temp_dir / "slow.xdmf2"), time_steps=time_steps)
+        generator.generate_fast(str(temp_dir / "fast.xdmf2"), time_steps=time_steps)
+
+        slow = (temp_dir / "slow.xdmf2").read_bytes()
+        assert (temp_dir / "fast.xdmf2").read_bytes() == slow
+
+    def test_generate_fast_with_cell_data(self, temp_dir, sample_grid_data):
+        """Test that grids with cell data fall back to generate."""
+        sample_grid_data["cell_data"] = {"cell_temp": np.ones(729)}
+        generator = XDMFGenerator(str(temp_dir / "test.h5"), sample_grid_data)
+
+        generator.generate_fast(str(temp_dir / "test.xdmf2"), time_steps=[0, 100])
+
+        tree = etree.parse(str(temp_dir / "test.xdmf2"))
+        cell_attrs = tree.findall(".//Attribute[@Center='Cell']")
+        assert len(cell_attrs) == 2
+
+    def test_xml_validity(self, temp_dir, pre_written_h5, shared_grid_data):
         """Test that generated XML is valid and parseable."""
-        h5_file = temp_dir / "test.h5"
         xdmf_file = temp_dir / "test.xdmf2"
 
-        with HDF5Writer(str(h5_file)) as writer:
-            writer.write(sample_grid_data)
-
-        generator = XDMFGenerator(str(h5_file), sample_grid_data)
+        generator = XDMFGenerator(str(pre_written_h5), shared_grid_data)
         generator.generate(str(xdmf_file))
 
         # Should parse without errors